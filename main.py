@@ -8,11 +8,13 @@ from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
 import os
 import sys
+from collections import Counter
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.gui.modern_base import ModernApp, MODERN_THEME
+from src.gui.tasks import read_fasta_sequence
 
 
 class BioinformaticsApp(ModernApp):
@@ -401,7 +403,7 @@ class BioinformaticsApp(ModernApp):
     
     def _build_fasta_processor_page(self, container: tk.Frame):
         """Build the FASTA processor page."""
-        from src.core.sequence_operations import gc_content, complement, reverse, reverse_complement
+        from src.core.sequence_operations import gc_content, complement, reverse, reverse_complement, is_valid_dna
         
         header = self.create_header(container, "📄 FASTA Processor")
         
@@ -443,8 +445,7 @@ class BioinformaticsApp(ModernApp):
                 self.show_message("Error", "Please enter a DNA sequence", 'error')
                 return
             
-            valid_chars = set("ACGT")
-            if not all(c in valid_chars for c in seq):
+            if not is_valid_dna(seq):
                 self.show_message("Error", "Invalid DNA sequence. Use only A, C, G, T.", 'error')
                 return
             
@@ -707,7 +708,8 @@ class BioinformaticsApp(ModernApp):
         """Build the approximate matching page."""
         from src.core.approximate_matching import (
             edit_distance, edit_distance_with_trace,
-            approximate_match, approximate_match_hamming
+            approximate_match, approximate_match_hamming,
+            TRACE_MAX_CELLS
         )
         
         header = self.create_header(container, "🎯 Approximate Match")
@@ -823,7 +825,12 @@ class BioinformaticsApp(ModernApp):
                             result_text.configure(state='disabled')
                             return
                     
-                    distance, ops = edit_distance_with_trace(seq1, seq2)
+                    # The traceback needs the whole DP matrix, so only
+                    # build it when that is cheap
+                    if len(seq1) * len(seq2) < TRACE_MAX_CELLS:
+                        distance, ops = edit_distance_with_trace(seq1, seq2)
+                    else:
+                        distance, ops = edit_distance(seq1, seq2), None
                     max_len = max(len(seq1), len(seq2))
                     similarity = (1 - distance / max_len) * 100 if max_len > 0 else 100
                     
@@ -831,12 +838,20 @@ class BioinformaticsApp(ModernApp):
                         f"═══ Edit Distance Analysis ═══\n\n"
                         f"Edit Distance: {distance}\n"
                         f"Similarity: {similarity:.2f}%\n\n"
-                        f"Operations:\n"
-                        f"  Matches: {ops.count('M')}\n"
-                        f"  Substitutions: {ops.count('S')}\n"
-                        f"  Insertions: {ops.count('I')}\n"
-                        f"  Deletions: {ops.count('D')}\n"
                     )
+                    if ops is None:
+                        result_text.insert(tk.END,
+                            "Operations: not shown for long sequences\n"
+                        )
+                    else:
+                        op_counts = Counter(ops)
+                        result_text.insert(tk.END,
+                            f"Operations:\n"
+                            f"  Matches: {op_counts['M']}\n"
+                            f"  Substitutions: {op_counts['S']}\n"
+                            f"  Insertions: {op_counts['I']}\n"
+                            f"  Deletions: {op_counts['D']}\n"
+                        )
                 else:
                     # Search mode
                     if algo == "hamming":
@@ -1137,19 +1152,40 @@ class BioinformaticsApp(ModernApp):
     # ==================== Helper Methods ====================
     
     def _load_fasta_to_entry(self, entry: tk.Entry, status_label=None):
-        """Load FASTA file content to an entry widget."""
+        """Load FASTA file content to an entry widget without blocking the UI."""
         file_path = self.choose_file("Select FASTA File")
         
-        if file_path:
-            sequence = self.read_fasta_file(file_path)
-            if sequence:
-                entry.delete(0, tk.END)
-                entry.insert(0, sequence.upper())
+        if not file_path:
+            return
+        
+        if status_label:
+            status_label.configure(
+                text=f"Loading {os.path.basename(file_path)}...",
+                fg=MODERN_THEME['text_muted']
+            )
+        
+        def on_loaded(sequence, error):
+            # The page may have been evicted while the file was loading
+            if not entry.winfo_exists():
+                return
+            
+            if error is not None:
                 if status_label:
-                    status_label.configure(
-                        text=f"Loaded: {os.path.basename(file_path)}",
-                        fg=MODERN_THEME['success']
-                    )
+                    status_label.configure(text="")
+                self.show_read_error(file_path, error)
+                return
+            
+            entry.delete(0, tk.END)
+            entry.insert(0, sequence)
+            if status_label:
+                status_label.configure(
+                    text=f"Loaded: {os.path.basename(file_path)}",
+                    fg=MODERN_THEME['success']
+                )
+        
+        self.run_in_background(
+            read_fasta_sequence, on_loaded, file_path
+        )
 
 
 def main():
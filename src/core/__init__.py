@@ -2,10 +2,12 @@
 
 from .sequence_operations import (
     gc_content,
+    is_valid_dna,
     complement,
     reverse,
     reverse_complement,
-    translate_dna_to_protein
+    translate_dna_to_protein,
+    find_start_codons
 )
 
 from .pattern_matching import (
@@ -16,18 +18,26 @@ from .pattern_matching import (
     build_border_array,
     good_suffix_match,
     boyer_moore_match,
-    boyer_moore_match_all
+    boyer_moore_match_all,
+    search,
+    multi_match
 )
 
 from .indexing import (
     build_sorted_index,
     query_index,
+    query_suffix_array,
     build_suffix_array,
     build_suffix_array_simple,
     build_inverse_suffix_array,
     build_suffix_array_with_inverse
 )
 
+from .indexing_fast import (
+    build_packed_index,
+    query_packed_index
+)
+
 from .sequence_analysis import (
     compute_overlap,
     parse_fasta_sequences,
@@ -45,6 +55,7 @@ from .approximate_matching import (
     edit_distance_with_trace,
     approximate_match,
     approximate_match_hamming,
+    approximate_match_hamming_indexed,
     hamming_distance,
     ApproximateMatch
 )
@@ -52,7 +63,11 @@ from .approximate_matching import (
 from .fasta_operations import (
     read_fasta_file,
     read_single_sequence,
+    read_sequence_bytes,
+    iter_fasta_lengths,
     get_fasta_statistics,
+    fasta_to_csv,
+    fasta_file_to_csv,
     validate_fasta_sequence,
     FastaSequence,
     FastaFile,
@@ -62,10 +77,12 @@ from .fasta_operations import (
 __all__ = [
     # Sequence operations
     'gc_content',
+    'is_valid_dna',
     'complement', 
     'reverse',
     'reverse_complement',
     'translate_dna_to_protein',
+    'find_start_codons',
     # Pattern matching
     'naive_match',
     'bad_character_match',
@@ -75,13 +92,18 @@ __all__ = [
     'good_suffix_match',
     'boyer_moore_match',
     'boyer_moore_match_all',
+    'search',
+    'multi_match',
     # Indexing and suffix arrays
     'build_sorted_index',
     'query_index',
+    'query_suffix_array',
     'build_suffix_array',
     'build_suffix_array_simple',
     'build_inverse_suffix_array',
     'build_suffix_array_with_inverse',
+    'build_packed_index',
+    'query_packed_index',
     # Overlap detection and graph
     'compute_overlap',
     'parse_fasta_sequences',
@@ -97,12 +119,17 @@ __all__ = [
     'edit_distance_with_trace',
     'approximate_match',
     'approximate_match_hamming',
+    'approximate_match_hamming_indexed',
     'hamming_distance',
     'ApproximateMatch',
     # FASTA operations
     'read_fasta_file',
     'read_single_sequence',
+    'read_sequence_bytes',
+    'iter_fasta_lengths',
     'get_fasta_statistics',
+    'fasta_to_csv',
+    'fasta_file_to_csv',
     'validate_fasta_sequence',
     'FastaSequence',
     'FastaFile',
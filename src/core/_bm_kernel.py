@@ -0,0 +1,68 @@
+"""
+Optional Numba-compiled kernel for Boyer-Moore bad character search.
+
+Numba is not a required dependency. When it is not installed the kernel
+stays a plain Python function and NUMBA_AVAILABLE is False, so
+bad_character_match() keeps using its pure-Python loop.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def last_occurrence_table(pattern: np.ndarray) -> np.ndarray:
+    """
+    Build the bad character table for a uint8 pattern.
+
+    Args:
+        pattern: Pattern as a uint8 array
+
+    Returns:
+        int32 array of 256 entries holding the last index of each byte
+        in pattern, or -1 for bytes that do not occur
+    """
+    table = np.full(256, -1, dtype=np.int32)
+    for j, byte in enumerate(pattern.tolist()):
+        table[byte] = j
+    return table
+
+
+def _bad_character_kernel(text: np.ndarray, pattern: np.ndarray,
+                          last: np.ndarray) -> int:
+    """
+    Find the first occurrence of pattern in text with the bad character rule.
+
+    Args:
+        text: Text as a uint8 array
+        pattern: Pattern as a uint8 array
+        last: Table from last_occurrence_table(pattern)
+
+    Returns:
+        Index of the first match, or -1 if not found
+    """
+    n = text.shape[0]
+    m = pattern.shape[0]
+    i = 0
+
+    while i <= n - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[i + j]:
+            j -= 1
+        if j < 0:
+            return i
+
+        shift = j - last[text[i + j]]
+        i += shift if shift > 1 else 1
+
+    return -1
+
+
+if NUMBA_AVAILABLE:
+    bad_character_kernel = njit(cache=True, boundscheck=False)(_bad_character_kernel)
+else:
+    bad_character_kernel = _bad_character_kernel
@@ -0,0 +1,56 @@
+"""
+Optional Numba-compiled kernels for approximate matching.
+
+Numba is not a required dependency. When it is not installed the kernels
+stay plain Python functions and NUMBA_AVAILABLE is False, so callers keep
+using the pure-Python implementations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _edit_distance_kernel(a: np.ndarray, b: np.ndarray) -> int:
+    """
+    Wagner-Fischer edit distance over two uint8 arrays.
+
+    Only a single int32 row of length len(b) + 1 is kept, so memory is
+    O(len(b)); pass the shorter sequence as b.
+
+    Args:
+        a: First sequence as a uint8 array
+        b: Second sequence as a uint8 array
+
+    Returns:
+        The edit distance between a and b
+    """
+    n = b.shape[0]
+    row = np.arange(n + 1, dtype=np.int32)
+
+    for i in range(1, a.shape[0] + 1):
+        diagonal = row[0]
+        row[0] = i
+        char = a[i - 1]
+
+        for j in range(1, n + 1):
+            above = row[j]
+            best = diagonal if char == b[j - 1] else diagonal + 1
+            if above + 1 < best:
+                best = above + 1
+            if row[j - 1] + 1 < best:
+                best = row[j - 1] + 1
+            row[j] = best
+            diagonal = above
+
+    return row[n]
+
+
+if NUMBA_AVAILABLE:
+    edit_distance_kernel = njit(cache=True)(_edit_distance_kernel)
+else:
+    edit_distance_kernel = _edit_distance_kernel
@@ -5,9 +5,18 @@ This module provides various approximate string matching algorithms
 commonly used in bioinformatics for DNA/protein sequence analysis.
 """
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
 from dataclasses import dataclass
 
+import numpy as np
+
+from ._fast_edit import NUMBA_AVAILABLE, edit_distance_kernel
+from .indexing import query_suffix_array
+
+# Largest DP matrix (len(x) * len(y)) for which callers should ask for a
+# traceback; the trace keeps the full matrix, distance alone is O(min(m, n))
+TRACE_MAX_CELLS = 1_000_000
+
 
 @dataclass
 class ApproximateMatch:
@@ -24,6 +33,7 @@ def edit_distance(x: str, y: str) -> int:
     
     The edit distance is the minimum number of single-character edits
     (insertions, deletions, substitutions) required to transform x into y.
+    Only two rows of the DP table are kept, so memory is O(min(m, n)).
     
     Args:
         x: First string (source)
@@ -36,32 +46,37 @@ def edit_distance(x: str, y: str) -> int:
         >>> edit_distance("ACGACGT", "TCGTACGT")
         2
     """
-    m, n = len(x), len(y)
+    # Keep y as the shorter string; only O(len(y)) memory is needed
+    if len(y) > len(x):
+        x, y = y, x
     
-    # Create DP table
-    D = [[0] * (n + 1) for _ in range(m + 1)]
+    # Use the compiled kernel when Numba is installed
+    if NUMBA_AVAILABLE and x.isascii() and y.isascii():
+        return int(edit_distance_kernel(
+            np.frombuffer(x.encode('ascii'), dtype=np.uint8),
+            np.frombuffer(y.encode('ascii'), dtype=np.uint8)
+        ))
     
-    # Initialize first column (deleting from x)
-    for i in range(m + 1):
-        D[i][0] = i
+    # Two-row DP: previous holds row i-1, current is filled for row i
+    previous = list(range(len(y) + 1))
     
-    # Initialize first row (inserting to x)
-    for j in range(n + 1):
-        D[0][j] = j
-    
-    # Fill the DP table
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
+    for i in range(1, len(x) + 1):
+        current = [i] + [0] * len(y)
+        char = x[i - 1]
+        
+        for j in range(1, len(y) + 1):
             # Cost is 0 if characters match, 1 otherwise
-            delta = 0 if x[i - 1] == y[j - 1] else 1
+            delta = 0 if char == y[j - 1] else 1
             
-            D[i][j] = min(
-                D[i - 1][j - 1] + delta,  # Substitution (or match)
-                D[i - 1][j] + 1,          # Deletion from x
-                D[i][j - 1] + 1           # Insertion to x
+            current[j] = min(
+                previous[j - 1] + delta,  # Substitution (or match)
+                previous[j] + 1,          # Deletion from x
+                current[j - 1] + 1        # Insertion to x
             )
+        
+        previous = current
     
-    return D[m][n]
+    return previous[-1]
 
 
 def edit_distance_with_trace(x: str, y: str) -> Tuple[int, List[str]]:
@@ -256,3 +271,48 @@ def approximate_match_hamming(text: str, pattern: str, max_mismatches: int) -> L
             matches.append(i)
     
     return matches
+
+
+def approximate_match_hamming_indexed(text: str, pattern: str, max_mismatches: int,
+                                      suffix_array: Union[List[int], np.ndarray]) -> List[int]:
+    """
+    Hamming-distance approximate matching using a suffix array of text.
+    
+    Uses the pigeonhole principle: if the pattern is split into
+    max_mismatches + 1 pieces, every match with at most max_mismatches
+    mismatches contains at least one piece exactly. Each piece is looked
+    up in the suffix array and only those candidate positions are verified.
+    
+    Args:
+        text: The text to search in
+        pattern: The pattern to search for
+        max_mismatches: Maximum allowed mismatches
+        suffix_array: Suffix array of text (see build_suffix_array)
+        
+    Returns:
+        List of positions where approximate matches were found
+    """
+    if not pattern or not text or len(pattern) > len(text):
+        return []
+    
+    m = len(pattern)
+    pieces = max_mismatches + 1
+    
+    # Pieces would be empty; every position is a candidate anyway
+    if m < pieces:
+        return approximate_match_hamming(text, pattern, max_mismatches)
+    
+    candidates = set()
+    for p in range(pieces):
+        start = p * m // pieces
+        end = (p + 1) * m // pieces
+        
+        for hit in query_suffix_array(text, pattern[start:end], suffix_array):
+            position = hit - start
+            if 0 <= position <= len(text) - m:
+                candidates.add(position)
+    
+    return [
+        position for position in sorted(candidates)
+        if hamming_distance(pattern, text[position:position + m]) <= max_mismatches
+    ]
@@ -0,0 +1,71 @@
+"""
+Vectorized FASTA scanning.
+
+Record boundaries are located with NumPy over a memory-mapped file
+instead of iterating over the file line by line in Python.
+"""
+
+import mmap
+
+import numpy as np
+
+
+_HEADER_START = 0x3E  # '>'
+_NEWLINE = 0x0A       # '\n'
+
+# Whitespace allowed before '>' on a header line
+_INDENT = b' \t\r\x0b\x0c'
+_INDENT_CODES = np.frombuffer(_INDENT, dtype=np.uint8)
+
+# Read-ahead hints for whole-file scans; constants only exist on
+# platforms where mmap.madvise is available (not on Windows)
+_SEQUENTIAL_ADVICE = [
+    getattr(mmap, name) for name in ('MADV_SEQUENTIAL', 'MADV_WILLNEED')
+    if hasattr(mmap, name)
+]
+
+
+def advise_sequential(mm: mmap.mmap) -> None:
+    """
+    Tell the kernel a memory map will be read front to back.
+
+    Enables aggressive read-ahead for the scan that follows. Does nothing
+    where madvise is not supported.
+
+    Args:
+        mm: Memory map about to be scanned
+    """
+    for advice in _SEQUENTIAL_ADVICE:
+        mm.madvise(advice)
+
+
+def find_header_offsets(buffer) -> np.ndarray:
+    """
+    Find the byte offsets of all FASTA header lines in a buffer.
+
+    A header is a line whose first non-whitespace character is '>';
+    a '>' inside a description is ignored.
+
+    Args:
+        buffer: Bytes-like object holding FASTA data (bytes, mmap, ...)
+
+    Returns:
+        Sorted int64 array of offsets of the '>' characters
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    starts = np.flatnonzero(data == _HEADER_START)
+    if not starts.size:
+        return starts
+
+    previous = data[np.maximum(starts - 1, 0)]
+    at_line_start = (starts == 0) | (previous == _NEWLINE)
+
+    # Rare case: '>' after whitespace, check back to the start of the line
+    indented = np.isin(previous, _INDENT_CODES) & (starts > 0)
+    for i in np.flatnonzero(indented).tolist():
+        j = int(starts[i]) - 1
+        while j >= 0 and int(data[j]) in _INDENT:
+            j -= 1
+        at_line_start[i] = j < 0 or data[j] == _NEWLINE
+
+    return starts[at_line_start]
@@ -6,9 +6,29 @@ FASTA files to various formats including CSV.
 """
 
 import os
-from typing import List, Tuple, Optional, Dict, Iterator
+import mmap
+from functools import lru_cache
+from typing import List, Tuple, Optional, Dict, Iterator, Callable
 from dataclasses import dataclass, field
 import csv
+import string
+
+import pandas as pd
+
+from .fasta_fast import advise_sequential, find_header_offsets
+
+
+# Bytes stripped from sequence data (line breaks and padding)
+_WHITESPACE = b' \t\r\n\x0b\x0c'
+
+# Rows written per to_csv call when converting FASTA to CSV
+CSV_CHUNK_ROWS = 100_000
+
+# ASCII uppercase table for bytes.translate
+_UPPER = bytes.maketrans(
+    string.ascii_lowercase.encode('ascii'),
+    string.ascii_uppercase.encode('ascii')
+)
 
 
 @dataclass
@@ -78,46 +98,49 @@ def read_fasta_file(filepath: str) -> FastaFile:
         raise FileNotFoundError(f"FASTA file not found: {filepath}")
     
     sequences = []
-    current_header = None
-    current_description = ""
-    current_sequence_lines = []
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise FastaParseError("No valid sequences found in FASTA file")
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            advise_sequential(mm)
+            starts = find_header_offsets(mm).tolist()
+            
+            # Only whitespace may precede the first header
+            leading = mm[:starts[0] if starts else len(mm)]
+            if leading.strip():
+                skipped = len(leading) - len(leading.lstrip())
+                line_num = leading.count(b'\n', 0, skipped) + 1
+                raise FastaParseError(
+                    f"Sequence data found before header at line {line_num}"
+                )
             
-            if not line:
-                continue
+            ends = starts[1:] + [len(mm)]
             
-            if line.startswith('>'):
-                # Save previous sequence if exists
-                if current_header is not None:
-                    sequences.append(FastaSequence(
-                        header=current_header,
-                        sequence="".join(current_sequence_lines),
-                        description=current_description
-                    ))
+            for start, end in zip(starts, ends):
+                header_end = mm.find(b'\n', start, end)
+                if header_end == -1:
+                    header_end = end
                 
-                # Parse new header
-                header_line = line[1:].strip()  # Remove '>'
+                # Parse header
+                header_line = mm[start + 1:header_end].decode('utf-8').strip()
                 parts = header_line.split(None, 1)  # Split on first whitespace
-                current_header = parts[0] if parts else f"seq_{line_num}"
-                current_description = parts[1] if len(parts) > 1 else ""
-                current_sequence_lines = []
-            else:
-                if current_header is None:
-                    raise FastaParseError(
-                        f"Sequence data found before header at line {line_num}"
-                    )
-                current_sequence_lines.append(line)
-    
-    # Don't forget the last sequence
-    if current_header is not None:
-        sequences.append(FastaSequence(
-            header=current_header,
-            sequence="".join(current_sequence_lines),
-            description=current_description
-        ))
+                if parts:
+                    header = parts[0]
+                else:
+                    line_num = mm[:start].count(b'\n') + 1
+                    header = f"seq_{line_num}"
+                
+                # Sequence body is everything up to the next header,
+                # with line breaks and padding removed in one C-level pass
+                body = mm[header_end + 1:end].translate(None, _WHITESPACE)
+                
+                sequences.append(FastaSequence(
+                    header=header,
+                    sequence=body.decode('utf-8'),
+                    description=parts[1] if len(parts) > 1 else ""
+                ))
     
     if not sequences:
         raise FastaParseError("No valid sequences found in FASTA file")
@@ -149,6 +172,47 @@ def read_single_sequence(filepath: str) -> Tuple[str, str]:
     return first_seq.header, first_seq.sequence
 
 
+def read_sequence_bytes(filepath: str) -> bytes:
+    """
+    Read all sequence data in a FASTA file as uppercase bytes.
+    
+    Header lines are skipped and the sequence lines of every record are
+    concatenated. Uppercasing and whitespace removal happen in a single
+    bytes.translate pass per record, so no intermediate str copies of the
+    sequence are made.
+    
+    Args:
+        filepath: Path to the FASTA file
+        
+    Returns:
+        Concatenated, uppercased sequence data (empty if there is none)
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"FASTA file not found: {filepath}")
+    
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            advise_sequential(mm)
+            starts = find_header_offsets(mm).tolist()
+            
+            # Sequence lines before the first header are kept as well
+            chunks = [mm[:starts[0] if starts else len(mm)]]
+            for start, end in zip(starts, starts[1:] + [len(mm)]):
+                header_end = mm.find(b'\n', start, end)
+                if header_end != -1:
+                    chunks.append(mm[header_end + 1:end])
+            
+            return b"".join(
+                chunk.translate(_UPPER, _WHITESPACE) for chunk in chunks
+            )
+
+
 def validate_fasta_sequence(sequence: str, alphabet: str = "ACGT") -> Tuple[bool, List[str]]:
     """
     Validate a FASTA sequence against a given alphabet.
@@ -171,33 +235,164 @@ def validate_fasta_sequence(sequence: str, alphabet: str = "ACGT") -> Tuple[bool
     return len(invalid_chars) == 0, invalid_chars
 
 
+def iter_fasta_lengths(filepath: str) -> Iterator[Tuple[str, int]]:
+    """
+    Iterate over the records of a FASTA file without building sequences.
+    
+    Only a running length is kept for each record, so memory use does not
+    depend on sequence size.
+    
+    Args:
+        filepath: Path to the FASTA file
+        
+    Yields:
+        Tuples of (header line without '>', sequence length)
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        FastaParseError: If sequence data appears before the first header
+    """
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"FASTA file not found: {filepath}")
+    
+    header = None
+    length = 0
+    
+    with open(filepath, 'rb', buffering=1 << 20) as f:
+        for line_num, line in enumerate(f, 1):
+            # Headers may be indented, as in read_fasta_file()
+            if line.lstrip().startswith(b'>'):
+                if header is not None:
+                    yield header, length
+                header = line.lstrip()[1:].decode('utf-8').strip()
+                length = 0
+            else:
+                stripped = line.translate(None, _WHITESPACE)
+                if stripped and header is None:
+                    raise FastaParseError(
+                        f"Sequence data found before header at line {line_num}"
+                    )
+                length += len(stripped)
+    
+    if header is not None:
+        yield header, length
+
+
+@lru_cache(maxsize=16)
+def _fasta_statistics(filepath: str, mtime_ns: int, size: int) -> Tuple[int, int, int, int]:
+    """Return (count, total, min, max) lengths; cached per file version."""
+    count = total = 0
+    min_length = max_length = 0
+    
+    for _, length in iter_fasta_lengths(filepath):
+        if count == 0 or length < min_length:
+            min_length = length
+        if length > max_length:
+            max_length = length
+        count += 1
+        total += length
+    
+    return count, total, min_length, max_length
+
+
 def get_fasta_statistics(filepath: str) -> Dict[str, any]:
     """
     Calculate statistics for a FASTA file.
     
+    The file is scanned once without building sequence strings, and the
+    result is cached until the file's modification time or size changes.
+    
     Args:
         filepath: Path to the FASTA file
         
     Returns:
         Dictionary containing various statistics
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        FastaParseError: If the file has no records
     """
-    fasta = read_fasta_file(filepath)
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"FASTA file not found: {filepath}")
     
-    if not fasta.sequences:
-        return {
-            'num_sequences': 0,
-            'total_length': 0,
-            'avg_length': 0,
-            'min_length': 0,
-            'max_length': 0
-        }
+    st = os.stat(filepath)
+    count, total, min_length, max_length = _fasta_statistics(
+        filepath, st.st_mtime_ns, st.st_size
+    )
     
-    lengths = [seq.length for seq in fasta.sequences]
+    # Same contract as read_fasta_file(), which the statistics used to use
+    if count == 0:
+        raise FastaParseError("No valid sequences found in FASTA file")
     
     return {
-        'num_sequences': len(fasta.sequences),
-        'total_length': sum(lengths),
-        'avg_length': sum(lengths) / len(lengths),
-        'min_length': min(lengths),
-        'max_length': max(lengths)
+        'num_sequences': count,
+        'total_length': total,
+        'avg_length': total / count,
+        'min_length': min_length,
+        'max_length': max_length
     }
+
+
+def fasta_file_to_csv(
+    fasta: FastaFile,
+    csv_path: str,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> int:
+    """
+    Write already-parsed FASTA records to CSV.
+    
+    Columns are ID, Header, Description, Sequence and Length, as in
+    FastaSequence.to_dict(). Rows are collected into a DataFrame and written
+    with pandas' C writer in chunks of CSV_CHUNK_ROWS rows. Use this instead
+    of fasta_to_csv() when the file has been loaded already.
+    
+    Args:
+        fasta: Parsed FASTA file
+        csv_path: Path of the CSV file to write
+        progress: Optional callback called as progress(rows_written, total)
+            after each chunk
+        
+    Returns:
+        Number of sequences written
+    """
+    df = pd.DataFrame({
+        'ID': [seq.id for seq in fasta],
+        'Header': [seq.header for seq in fasta],
+        'Description': [seq.description for seq in fasta],
+        'Sequence': [seq.sequence for seq in fasta],
+        'Length': [seq.length for seq in fasta]
+    })
+    
+    total = len(df)
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        for start in range(0, total, CSV_CHUNK_ROWS):
+            df.iloc[start:start + CSV_CHUNK_ROWS].to_csv(
+                f, index=False, header=(start == 0)
+            )
+            if progress:
+                progress(min(start + CSV_CHUNK_ROWS, total), total)
+    
+    return total
+
+
+def fasta_to_csv(
+    fasta_path: str,
+    csv_path: str,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> int:
+    """
+    Convert a FASTA file to CSV.
+    
+    Args:
+        fasta_path: Path to the FASTA file
+        csv_path: Path of the CSV file to write
+        progress: Optional callback, see fasta_file_to_csv()
+        
+    Returns:
+        Number of sequences written
+        
+    Raises:
+        FileNotFoundError: If the FASTA file doesn't exist
+        FastaParseError: If the FASTA file format is invalid
+    """
+    return fasta_file_to_csv(read_fasta_file(fasta_path), csv_path, progress)
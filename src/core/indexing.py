@@ -3,7 +3,9 @@ Indexing algorithms for efficient sequence searching.
 """
 
 import bisect
-from typing import Optional
+from typing import Optional, Union
+
+import numpy as np
 
 
 def build_sorted_index(text: str, kmer_length: int) -> list[tuple[str, int]]:
@@ -47,12 +49,11 @@ def query_index(text: str, pattern: str, index: list[tuple[str, int]]) -> list[i
     kmer_length = len(index[0][0])
     prefix = pattern[:kmer_length]
     
-    # Extract keys for binary search
-    keys = [entry[0] for entry in index]
-    
-    # Find range of matching k-mers
-    start = bisect.bisect_left(keys, prefix)
-    end = bisect.bisect_right(keys, prefix)
+    # Find range of matching k-mers by bisecting the (kmer, position)
+    # tuples directly; every position is < len(text), so the two probes
+    # bracket all entries for prefix without building a separate key list
+    start = bisect.bisect_left(index, (prefix,))
+    end = bisect.bisect_right(index, (prefix, len(text)))
     
     # Verify full pattern match at each candidate position
     offsets = []
@@ -64,37 +65,115 @@ def query_index(text: str, pattern: str, index: list[tuple[str, int]]) -> list[i
     return offsets
 
 
-def build_suffix_array(text: str) -> tuple[dict[str, int], list[list]]:
+def query_suffix_array(text: str, pattern: str,
+                       suffix_array: Union[list[int], np.ndarray]) -> list[int]:
     """
-    Build a suffix array for a text string.
+    Find all occurrences of a pattern using a suffix array.
+    
+    The suffixes starting with the pattern form a contiguous block of the
+    suffix array, located with two binary searches.
     
     Args:
-        text: The text to build suffix array for
+        text: The original text
+        pattern: The pattern to search for
+        suffix_array: Starting positions of the sorted suffixes of text
+            (list or NumPy array)
         
     Returns:
-        Tuple of (suffix_to_rank, suffix_table)
-        - suffix_to_rank: Dictionary mapping each suffix to its rank
-        - suffix_table: List of [suffix, original_position, sorted_rank]
+        Sorted list of positions where pattern occurs
     """
-    if not text:
-        return {}, []
+    if len(suffix_array) == 0 or not pattern or not text:
+        return []
     
-    # Generate all suffixes with their positions
-    suffixes = [(text[i:], i) for i in range(len(text))]
+    m = len(pattern)
+    
+    # First suffix whose m-character prefix is >= pattern
+    lo, hi = 0, len(suffix_array)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if text[suffix_array[mid]:suffix_array[mid] + m] < pattern:
+            lo = mid + 1
+        else:
+            hi = mid
+    start = lo
+    
+    # First suffix whose m-character prefix is > pattern
+    hi = len(suffix_array)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if text[suffix_array[mid]:suffix_array[mid] + m] == pattern:
+            lo = mid + 1
+        else:
+            hi = mid
+    
+    return sorted(map(int, suffix_array[start:lo]))
+
+
+def build_suffix_array(text: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build a suffix array for a text string.
+    
+    Suffixes are identified by their start positions only; slice
+    text[pos:pos + width] where a suffix needs to be shown.
     
-    # Sort suffixes alphabetically
-    sorted_suffixes = sorted(suffixes, key=lambda x: x[0])
+    Args:
+        text: The text to build suffix array for
+        
+    Returns:
+        Tuple of (ranks, suffix_array) as integer NumPy arrays
+        - ranks: ranks[i] is the sorted rank of the suffix starting at i
+        - suffix_array: Starting positions of the suffixes in sorted order
+    """
+    n = len(text)
+    dtype = np.int32 if n < 2**31 else np.int64
+    if n == 0:
+        return np.empty(0, dtype=dtype), np.empty(0, dtype=dtype)
+    
+    # Prefix doubling is O(n log n), but each round is a handful of NumPy
+    # passes with no per-suffix Python work
+    ranks, suffix_array = _prefix_doubling(text)
+    return ranks.astype(dtype), suffix_array.astype(dtype)
+
+
+def _prefix_doubling(text: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sort the suffixes of text by prefix doubling over integer ranks.
     
-    # Create suffix to rank mapping
-    suffix_to_rank = {suffix: rank for rank, (suffix, _) in enumerate(sorted_suffixes)}
+    Round k sorts suffixes by their first 2k characters, using the pair
+    (rank[i], rank[i + k]) packed into one int64 key, so no suffix is
+    ever sliced or compared as a string. Stops once all ranks differ.
     
-    # Build result table
-    suffix_table = []
-    for i in range(len(text)):
-        suffix = text[i:]
-        suffix_table.append([suffix, i, suffix_to_rank[suffix]])
+    Args:
+        text: The text to sort the suffixes of (non-empty)
+        
+    Returns:
+        Tuple of (ranks, suffix_array) as int64 NumPy arrays
+    """
+    n = len(text)
     
-    return suffix_to_rank, suffix_table
+    # Initial ranks: characters mapped to dense ranks in code point order
+    code_points = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    _, rank = np.unique(code_points, return_inverse=True)
+    rank = rank.astype(np.int64).reshape(-1)
+    
+    k = 1
+    while True:
+        # Second key is rank[i + k] + 1, or 0 past the end of the text
+        second = np.zeros(n, dtype=np.int64)
+        if k < n:
+            second[:n - k] = rank[k:] + 1
+        key = rank * (n + 1) + second
+        
+        order = np.argsort(key, kind='stable')
+        sorted_key = key[order]
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.concatenate(
+            ([0], np.cumsum(sorted_key[1:] != sorted_key[:-1]))
+        )
+        
+        if rank[order[-1]] == n - 1 or k >= n:
+            return rank, order
+        k *= 2
 
 
 def build_suffix_array_simple(text: str) -> list[int]:
@@ -110,14 +189,8 @@ def build_suffix_array_simple(text: str) -> list[int]:
     if not text:
         return []
     
-    # Generate all suffixes with their positions
-    suffixes = [(text[i:], i) for i in range(len(text))]
-    
-    # Sort suffixes alphabetically
-    sorted_suffixes = sorted(suffixes, key=lambda x: x[0])
-    
-    # Return only the positions
-    return [pos for _, pos in sorted_suffixes]
+    _, suffix_array = _prefix_doubling(text)
+    return suffix_array.tolist()
 
 
 def build_inverse_suffix_array(text: str) -> list[int]:
@@ -143,17 +216,9 @@ def build_inverse_suffix_array(text: str) -> list[int]:
     if not text:
         return []
     
-    # First build the suffix array
-    suffix_array = build_suffix_array_simple(text)
-    
-    # Build inverse suffix array
-    n = len(text)
-    inverse_sa = [0] * n
-    
-    for rank, position in enumerate(suffix_array):
-        inverse_sa[position] = rank
-    
-    return inverse_sa
+    # Prefix doubling yields the final ranks, i.e. the inverse suffix array
+    inverse_sa, _ = _prefix_doubling(text)
+    return inverse_sa.tolist()
 
 
 def build_suffix_array_with_inverse(text: str) -> tuple[list[int], list[int]]:
@@ -171,20 +236,5 @@ def build_suffix_array_with_inverse(text: str) -> tuple[list[int], list[int]]:
     if not text:
         return [], []
     
-    # Generate all suffixes with their positions
-    suffixes = [(text[i:], i) for i in range(len(text))]
-    
-    # Sort suffixes alphabetically
-    sorted_suffixes = sorted(suffixes, key=lambda x: x[0])
-    
-    # Build suffix array
-    suffix_array = [pos for _, pos in sorted_suffixes]
-    
-    # Build inverse suffix array
-    n = len(text)
-    inverse_sa = [0] * n
-    
-    for rank, position in enumerate(suffix_array):
-        inverse_sa[position] = rank
-    
-    return suffix_array, inverse_sa
+    inverse_sa, suffix_array = _prefix_doubling(text)
+    return suffix_array.tolist(), inverse_sa.tolist()
@@ -0,0 +1,194 @@
+"""
+Packed k-mer index for DNA sequences.
+
+Each base is encoded in 2 bits, so a k-mer of up to 32 bases packs into a
+single uint64. The index is a sorted array of those packed values plus the
+matching start positions, queried with binary search (np.searchsorted).
+K-mers overlapping ambiguous bases such as N are left out of the index.
+
+When Numba is installed the packing loop is JIT-compiled; otherwise a
+vectorized NumPy version is used. Either way no per-k-mer Python objects
+are created.
+"""
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+MAX_KMER_LENGTH = 32
+_INVALID = 0xFF
+
+# Byte -> 2-bit code lookup table; anything other than ACGT is invalid
+_LUT = np.full(256, _INVALID, dtype=np.uint8)
+for _code, _bases in enumerate((b'Aa', b'Cc', b'Gg', b'Tt')):
+    for _base in _bases:
+        _LUT[_base] = _code
+_LUT_TABLE = _LUT.tobytes()
+
+
+def encode_dna(sequence: Union[str, bytes]) -> np.ndarray:
+    """
+    Encode a DNA sequence as an array of 2-bit codes (A=0, C=1, G=2, T=3).
+
+    Ambiguous bases such as N, and any other character, are encoded as
+    _INVALID so callers can skip the k-mers that contain them.
+
+    Args:
+        sequence: DNA sequence (case-insensitive)
+
+    Returns:
+        uint8 array with one code per character
+    """
+    if isinstance(sequence, str):
+        # One '?' per non-ASCII character keeps positions aligned
+        sequence = sequence.encode('ascii', errors='replace')
+
+    return _LUT[np.frombuffer(sequence, dtype=np.uint8)]
+
+
+def _valid_windows(codes: np.ndarray, k: int) -> np.ndarray:
+    """Return the start positions of k-mers containing no invalid code."""
+    invalid = codes == _INVALID
+    n = codes.shape[0] - k + 1
+    if not invalid.any():
+        return np.arange(n)
+
+    has_invalid = invalid[:n].copy()
+    for j in range(1, k):
+        has_invalid |= invalid[j:j + n]
+    return np.flatnonzero(~has_invalid)
+
+
+def _pack_kmers_numpy(codes: np.ndarray, k: int) -> np.ndarray:
+    """Pack every k-mer of codes into a uint64, one shift/OR per base."""
+    n = codes.shape[0] - k + 1
+    packed = np.zeros(n, dtype=np.uint64)
+    for j in range(k):
+        packed <<= np.uint64(2)
+        packed |= codes[j:j + n]
+    return packed
+
+
+def _pack_kmers_kernel(codes: np.ndarray, k: int) -> np.ndarray:
+    """Pack every k-mer of codes into a uint64 with a rolling hash."""
+    n = codes.shape[0] - k + 1
+    packed = np.empty(n, dtype=np.uint64)
+    mask = np.uint64(0xFFFFFFFFFFFFFFFF) >> np.uint64(64 - 2 * k)
+
+    value = np.uint64(0)
+    for i in range(k - 1):
+        value = (value << np.uint64(2)) | np.uint64(codes[i])
+    for i in range(n):
+        value = ((value << np.uint64(2)) | np.uint64(codes[i + k - 1])) & mask
+        packed[i] = value
+    return packed
+
+
+def pack_kmer(kmer: Union[str, bytes]) -> Optional[int]:
+    """
+    Pack a single k-mer into the integer key used by the packed index.
+
+    Validation and encoding are one bytes.translate call through the
+    2-bit lookup table; no NumPy arrays are created.
+
+    Args:
+        kmer: DNA k-mer of at most 32 bases (case-insensitive)
+
+    Returns:
+        Packed key, or None if kmer is empty, too long or not pure ACGT
+    """
+    if isinstance(kmer, str):
+        if not kmer.isascii():
+            return None
+        kmer = kmer.encode('ascii')
+
+    if not kmer or len(kmer) > MAX_KMER_LENGTH:
+        return None
+
+    codes = kmer.translate(_LUT_TABLE)
+    if _INVALID in codes:
+        return None
+
+    key = 0
+    for code in codes:
+        key = (key << 2) | code
+    return key
+
+
+if NUMBA_AVAILABLE:
+    _pack_kmers = njit(cache=True)(_pack_kmers_kernel)
+else:
+    _pack_kmers = _pack_kmers_numpy
+
+
+def build_packed_index(
+    text: Union[str, bytes],
+    kmer_length: int
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Build a sorted index of 2-bit packed k-mers.
+
+    Stores one uint64 and one position per k-mer instead of the (str, int)
+    tuple of build_sorted_index(). K-mers containing anything other than
+    A, C, G or T (e.g. the N runs of an assembly) are left out; patterns
+    are pure ACGT, so they could never match those windows anyway.
+
+    Args:
+        text: DNA sequence to index (case-insensitive)
+        kmer_length: Length of k-mers to index (at most 32)
+
+    Returns:
+        Tuple of (sorted packed k-mers, start positions), or None if
+        kmer_length is out of range
+    """
+    if kmer_length <= 0 or kmer_length > MAX_KMER_LENGTH:
+        return None
+
+    codes = encode_dna(text)
+    if kmer_length > codes.size:
+        return None
+
+    # Invalid codes are packed as 0 and their windows dropped afterwards
+    packed = _pack_kmers(codes & np.uint8(3), kmer_length)
+    positions = _valid_windows(codes, kmer_length)
+    if positions.size < packed.size:
+        packed = packed[positions]
+
+    # Stable sort keeps equal k-mers in ascending position order
+    order = np.argsort(packed, kind='stable')
+    return packed[order], positions[order]
+
+
+def query_packed_index(
+    pattern: Union[str, bytes],
+    index: Tuple[np.ndarray, np.ndarray]
+) -> list[int]:
+    """
+    Find all occurrences of a pattern in a packed k-mer index.
+
+    The index must have been built with kmer_length == len(pattern).
+
+    Args:
+        pattern: DNA pattern to search for (case-insensitive)
+        index: Index returned by build_packed_index()
+
+    Returns:
+        Sorted list of positions where pattern occurs
+    """
+    key = pack_kmer(pattern)
+    if key is None:
+        return []
+
+    packed, positions = index
+    key = np.uint64(key)
+    start = np.searchsorted(packed, key, side='left')
+    end = np.searchsorted(packed, key, side='right')
+
+    return positions[start:end].tolist()
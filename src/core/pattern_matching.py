@@ -2,43 +2,93 @@
 Pattern matching algorithms for DNA sequence analysis.
 """
 
-from typing import Optional
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Optional, Union
 import numpy as np
 
+from ._bm_kernel import NUMBA_AVAILABLE, bad_character_kernel, last_occurrence_table
 
-def naive_match(text: str, pattern: str) -> int:
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# naive_match_all compares whole columns of bytes with NumPy for short
+# patterns in long ASCII texts; below these sizes the Python loop is cheaper
+VECTOR_MAX_PATTERN = 32
+VECTOR_MIN_TEXT = 1024
+
+# search() uses naive matching below this len(text) * len(pattern), where
+# building the bad character table costs more than the scan it saves
+SEARCH_NAIVE_MAX_WORK = 10_000
+SEARCH_NAIVE_MAX_PATTERN = 3
+
+Sequence = Union[str, bytes, bytearray]
+
+
+def _as_bytes(text: Sequence, pattern: Sequence) -> tuple:
+    """
+    Convert text and pattern to bytes if either of them is bytes-like.
+    
+    Two str inputs are returned unchanged: encoding the text up front
+    would cost a full pass even when the match is at the start.
+    """
+    if isinstance(text, str) and isinstance(pattern, str):
+        return text, pattern
+    
+    if isinstance(text, str):
+        text = text.encode('ascii')
+    if isinstance(pattern, str):
+        pattern = pattern.encode('ascii')
+    return bytes(text), bytes(pattern)
+
+
+def naive_match(text: Sequence, pattern: Sequence) -> int:
     """
     Find the first occurrence of a pattern in text using naive matching.
     
     Args:
-        text: The text to search in
-        pattern: The pattern to search for
+        text: The text to search in (str or bytes)
+        pattern: The pattern to search for (str or bytes)
         
     Returns:
         Index of first match, or -1 if not found
     """
     if not pattern or not text:
         return -1
-        
+    
+    text, pattern = _as_bytes(text, pattern)
     for i in range(len(text) - len(pattern) + 1):
         if text[i:i + len(pattern)] == pattern:
             return i
     return -1
 
 
-def naive_match_all(text: str, pattern: str) -> list[int]:
+def naive_match_all(text: Sequence, pattern: Sequence) -> list[int]:
     """
     Find all occurrences of a pattern in text using naive matching.
     
     Args:
-        text: The text to search in
-        pattern: The pattern to search for
+        text: The text to search in (str or bytes)
+        pattern: The pattern to search for (str or bytes)
         
     Returns:
         List of all match indices
     """
     if not pattern or not text:
         return []
+    
+    text, pattern = _as_bytes(text, pattern)
+    
+    # Every position is checked anyway, so encoding ASCII str costs no extra pass
+    if len(pattern) <= VECTOR_MAX_PATTERN and len(text) > VECTOR_MIN_TEXT:
+        if isinstance(text, str) and text.isascii() and pattern.isascii():
+            text, pattern = text.encode('ascii'), pattern.encode('ascii')
+        if isinstance(text, bytes):
+            return _naive_match_all_vectorized(text, pattern)
         
     matches = []
     for i in range(len(text) - len(pattern) + 1):
@@ -47,6 +97,27 @@ def naive_match_all(text: str, pattern: str) -> list[int]:
     return matches
 
 
+def _naive_match_all_vectorized(text: bytes, pattern: bytes) -> list[int]:
+    """
+    naive_match_all() for bytes, one NumPy comparison per pattern byte.
+    
+    Equivalent to comparing every window of text against pattern, but
+    only a single boolean row of len(text) is kept instead of a
+    len(text) x len(pattern) window matrix.
+    """
+    t = np.frombuffer(text, dtype=np.uint8)
+    p = np.frombuffer(pattern, dtype=np.uint8)
+    n = t.size - p.size + 1
+    if n <= 0:
+        return []
+    
+    hits = t[:n] == p[0]
+    for j in range(1, p.size):
+        hits &= t[j:j + n] == p[j]
+    
+    return np.flatnonzero(hits).tolist()
+
+
 def build_bad_character_table(pattern: str, alphabet: str = "ACGT") -> dict[str, list[int]]:
     """
     Build the bad character table for Boyer-Moore algorithm.
@@ -78,13 +149,47 @@ def build_bad_character_table(pattern: str, alphabet: str = "ACGT") -> dict[str,
     return table
 
 
-def bad_character_match(text: str, pattern: str) -> int:
+@lru_cache(maxsize=128)
+def _bad_character_shifts(pattern: Union[str, bytes]) -> MappingProxyType:
+    """
+    Bad character shifts used by bad_character_match(), cached per pattern.
+    
+    For each base and pattern position j, the shift is -1 if the base is
+    pattern[j], otherwise the distance back to its previous occurrence
+    (or to the pattern start). Keys are characters for a str pattern and
+    byte values for a bytes pattern. The result is shared between callers,
+    so it is returned as a read-only mapping of tuples.
+    """
+    shifts = {}
+    for char in (b"ACGT" if isinstance(pattern, bytes) else "ACGT"):
+        row = []
+        count = 0
+        for j in range(len(pattern)):
+            if char == pattern[j]:
+                row.append(-1)
+                count = 0
+            else:
+                row.append(count)
+                count += 1
+        shifts[char] = tuple(row)
+    return MappingProxyType(shifts)
+
+
+@lru_cache(maxsize=128)
+def _last_occurrence_for(pattern: bytes) -> np.ndarray:
+    """Read-only last_occurrence_table() of a pattern, cached."""
+    table = last_occurrence_table(np.frombuffer(pattern, dtype=np.uint8))
+    table.setflags(write=False)
+    return table
+
+
+def bad_character_match(text: Sequence, pattern: Sequence) -> int:
     """
     Find pattern in text using Boyer-Moore bad character heuristic.
     
     Args:
-        text: The text to search in
-        pattern: The pattern to search for
+        text: The text to search in (str or bytes)
+        pattern: The pattern to search for (str or bytes)
         
     Returns:
         Index of first match, or -1 if not found
@@ -92,24 +197,21 @@ def bad_character_match(text: str, pattern: str) -> int:
     if not pattern or not text or len(pattern) > len(text):
         return -1
     
-    alphabet = "ACGT"
+    text, pattern = _as_bytes(text, pattern)
+    
+    # Use the compiled kernel when Numba is installed and input is bytes
+    if NUMBA_AVAILABLE and isinstance(text, bytes):
+        return int(bad_character_kernel(
+            np.frombuffer(text, dtype=np.uint8),
+            np.frombuffer(pattern, dtype=np.uint8),
+            _last_occurrence_for(pattern)
+        ))
+    
     n = len(text)
     m = len(pattern)
     
-    # Build bad character table using numpy for efficiency
-    table = np.zeros((4, m), dtype=int)
-    char_to_idx = {"A": 0, "C": 1, "G": 2, "T": 3}
-    
-    for i in range(4):
-        char = alphabet[i]
-        count = 0
-        for j in range(m):
-            if char == pattern[j]:
-                table[i, j] = -1
-                count = 0
-            else:
-                table[i, j] = count
-                count += 1
+    # Bad character table, built once per distinct pattern
+    table = _bad_character_shifts(pattern)
     
     # Search for pattern
     result = -1
@@ -124,10 +226,9 @@ def bad_character_match(text: str, pattern: str) -> int:
         # Find mismatch from right to left
         for j in range(i + m - 1, i - 1, -1):
             if text[j] != pattern[j - i]:
-                if text[j] in char_to_idx:
-                    k = char_to_idx[text[j]]
-                    shift = table[k, j - i]
-                    i += max(1, int(shift))
+                if text[j] in table:
+                    shift = table[text[j]][j - i]
+                    i += max(1, shift)
                 else:
                     i += 1
                 break
@@ -373,3 +474,114 @@ def boyer_moore_match_all(text: str, pattern: str) -> list[int]:
             i += max(bad_char_shift, good_suffix_shift, 1)
     
     return matches
+
+
+def search(text: Sequence, pattern: Sequence) -> int:
+    """
+    Find the first occurrence of a pattern, picking the matcher by input size.
+    
+    Small inputs and very short patterns use naive_match(); everything
+    else uses bad_character_match().
+    
+    Args:
+        text: The text to search in (str or bytes)
+        pattern: The pattern to search for (str or bytes)
+        
+    Returns:
+        Index of first match, or -1 if not found
+    """
+    if not text or not pattern:
+        return -1
+    
+    if (len(text) * len(pattern) < SEARCH_NAIVE_MAX_WORK
+            or len(pattern) <= SEARCH_NAIVE_MAX_PATTERN):
+        return naive_match(text, pattern)
+    return bad_character_match(text, pattern)
+
+
+class _AhoCorasick:
+    """Pure-Python Aho-Corasick automaton, used when pyahocorasick is missing."""
+    
+    def __init__(self, patterns: tuple[str, ...]):
+        # State 0 is the root; goto[s] maps a character to the next state
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.output: list[list[str]] = [[]]
+        
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(pattern)
+        
+        # Breadth-first: fail links point to the longest proper suffix
+        # that is also a trie path; outputs inherit along fail links
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] = (
+                    self.output[next_state] + self.output[self.fail[next_state]]
+                )
+    
+    def iter(self, text: str) -> Iterable[tuple[int, str]]:
+        """Yield (end_index, pattern) for every match, in order of end index."""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern in output[state]:
+                yield end, pattern
+
+
+@lru_cache(maxsize=8)
+def _build_automaton(patterns: tuple[str, ...]):
+    """Build (and cache) an Aho-Corasick automaton for a set of patterns."""
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return automaton
+    return _AhoCorasick(patterns)
+
+
+def multi_match(text: str, patterns: Iterable[str]) -> dict[str, list[int]]:
+    """
+    Find all occurrences of many patterns in a single pass over text.
+    
+    Builds an Aho-Corasick automaton (pyahocorasick when installed, a
+    pure-Python automaton otherwise) so the text is scanned once for all
+    patterns instead of once per pattern. Automata are cached for the
+    most recently used pattern sets.
+    
+    Args:
+        text: The text to search in
+        patterns: The patterns to search for; empty patterns are ignored
+        
+    Returns:
+        Dictionary mapping each distinct pattern to the sorted list of its
+        (possibly overlapping) match positions, as naive_match_all() gives
+    """
+    unique = tuple(sorted({pattern for pattern in patterns if pattern}))
+    matches = {pattern: [] for pattern in unique}
+    if not unique or not text:
+        return matches
+    
+    for end, pattern in _build_automaton(unique).iter(text):
+        matches[pattern].append(end - len(pattern) + 1)
+    return matches
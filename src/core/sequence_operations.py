@@ -2,8 +2,11 @@
 Core sequence operations for DNA/RNA/Protein analysis.
 """
 
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
+
 # Standard genetic code - DNA codon to amino acid mapping
 CODON_TABLE = {
     "TTT": "F", "TTC": "F", "TTA": "L", "TTG": "L",
@@ -27,13 +30,40 @@ CODON_TABLE = {
 # DNA complement mapping
 COMPLEMENT_MAP = {"A": "T", "T": "A", "G": "C", "C": "G"}
 
+# str.translate tables: complement (either case -> uppercase) and a
+# table deleting valid bases, leaving only invalid characters
+_COMPLEMENT_TABLE = str.maketrans("ACGTacgt", "TGCATGCA")
+_DEL_ACGT = str.maketrans("", "", "ACGTacgt")
+_VALID_BYTES = b"ACGTacgt"
+
+# Byte -> base code (A=0, C=1, G=2, T=3, either case); 4 marks invalid
+_INVALID_BASE = 4
+_BASE_CODES = np.full(256, _INVALID_BASE, dtype=np.uint8)
+for _code, _bases in enumerate(("Aa", "Cc", "Gg", "Tt")):
+    for _base in _bases:
+        _BASE_CODES[ord(_base)] = _code
+
+# Amino acid byte for codon index 16*b1 + 4*b2 + b3 (AAA, AAC, ..., TTT)
+_AMINO_ACIDS = np.frombuffer(
+    "".join(
+        CODON_TABLE[b1 + b2 + b3]
+        for b1 in "ACGT" for b2 in "ACGT" for b3 in "ACGT"
+    ).encode("ascii"),
+    dtype=np.uint8
+)
+_START_CODON_INDEX = 16 * 0 + 4 * 3 + 2  # ATG
+
+# Longest sequence whose translation is memoized; longer inputs are
+# translated every time so the cache cannot pin large strings
+TRANSLATE_CACHE_MAX_LENGTH = 100_000
+
 
 def gc_content(sequence: str) -> float:
     """
     Calculate the GC content of a DNA sequence.
     
     Args:
-        sequence: DNA sequence string (uppercase)
+        sequence: DNA sequence string (case-insensitive)
         
     Returns:
         GC content as a ratio (0.0 to 1.0)
@@ -44,9 +74,34 @@ def gc_content(sequence: str) -> float:
     if not sequence:
         raise ValueError("Sequence cannot be empty")
     
-    sequence = sequence.upper()
-    gc_count = sequence.count("G") + sequence.count("C")
-    return gc_count / len(sequence)
+    # Count G/C in either case over the raw bytes; non-ASCII becomes '?'
+    codes = np.frombuffer(sequence.encode('ascii', errors='replace'), dtype=np.uint8)
+    gc_mask = (codes == ord('G')) | (codes == ord('C')) | (codes == ord('g')) | (codes == ord('c'))
+    return int(np.count_nonzero(gc_mask)) / len(sequence)
+
+
+def is_valid_dna(sequence: str) -> bool:
+    """
+    Check that a sequence contains only A, C, G and T (either case).
+    
+    The scan is a bytes.translate that deletes valid bases, so a clean
+    sequence costs one pass in C and no per-character Python work.
+    
+    Args:
+        sequence: DNA sequence string
+        
+    Returns:
+        True if every character is a valid base
+    """
+    return not sequence.encode("ascii", errors="replace").translate(None, _VALID_BYTES)
+
+
+def _check_nucleotides(sequence: str) -> None:
+    """Raise ValueError naming the first character that is not A, C, G or T."""
+    if not is_valid_dna(sequence):
+        # Report the original character, not its '?' replacement
+        invalid = sequence.translate(_DEL_ACGT)
+        raise ValueError(f"Invalid nucleotide: {invalid[0].upper()}")
 
 
 def complement(sequence: str) -> str:
@@ -62,15 +117,9 @@ def complement(sequence: str) -> str:
     Raises:
         ValueError: If sequence contains invalid characters
     """
-    sequence = sequence.upper()
-    result = []
+    _check_nucleotides(sequence)
     
-    for nucleotide in sequence:
-        if nucleotide not in COMPLEMENT_MAP:
-            raise ValueError(f"Invalid nucleotide: {nucleotide}")
-        result.append(COMPLEMENT_MAP[nucleotide])
-    
-    return "".join(result)
+    return sequence.translate(_COMPLEMENT_TABLE)
 
 
 def reverse(sequence: str) -> str:
@@ -95,8 +144,14 @@ def reverse_complement(sequence: str) -> str:
         
     Returns:
         Reverse complement of the sequence
+        
+    Raises:
+        ValueError: If sequence contains invalid characters
     """
-    return complement(reverse(sequence))
+    _check_nucleotides(sequence)
+    
+    # Complement and reverse in one translate plus one slice
+    return sequence.translate(_COMPLEMENT_TABLE)[::-1]
 
 
 def translate_dna_to_protein(sequence: str) -> tuple[str, str]:
@@ -114,28 +169,68 @@ def translate_dna_to_protein(sequence: str) -> tuple[str, str]:
     Raises:
         ValueError: If sequence contains invalid codons
     """
-    sequence = sequence.upper()
-    full_translation = []
-    orf_translation = []
-    in_orf = False
-    
-    # Process sequence in codons (groups of 3)
-    for i in range(0, len(sequence) - 2, 3):
-        codon = sequence[i:i + 3]
-        
-        if codon not in CODON_TABLE:
-            raise ValueError(f"Invalid codon: {codon}")
-        
-        amino_acid = CODON_TABLE[codon]
-        full_translation.append(amino_acid)
+    if len(sequence) <= TRANSLATE_CACHE_MAX_LENGTH:
+        return _translate_cached(sequence)
+    return _translate(sequence)
+
+
+def _translate(sequence: str) -> tuple[str, str]:
+    """Translate sequence; see translate_dna_to_protein()."""
+    # Encode whole codons (a trailing partial codon is ignored); each
+    # non-ASCII character becomes one '?' so offsets match the string
+    n_codons = len(sequence) // 3
+    raw = sequence.encode("ascii", errors="replace")
+    codes = _BASE_CODES[np.frombuffer(raw, dtype=np.uint8, count=3 * n_codons)]
+    codes = codes.reshape(n_codons, 3)
+    
+    invalid = np.flatnonzero((codes == _INVALID_BASE).any(axis=1))
+    if invalid.size:
+        start = 3 * int(invalid[0])
+        raise ValueError(f"Invalid codon: {sequence[start:start + 3].upper()}")
+    
+    codon_index = (codes[:, 0] << 4) | (codes[:, 1] << 2) | codes[:, 2]
+    full_translation = _AMINO_ACIDS[codon_index].tobytes().decode("ascii")
+    
+    # ORF (Open Reading Frame): from each M up to, not including, the next stop
+    orf_translation = "".join(
+        segment[segment.find("M"):]
+        for segment in full_translation.split("*")
+        if "M" in segment
+    )
+    
+    return full_translation, orf_translation
+
+
+_translate_cached = lru_cache(maxsize=256)(_translate)
+
+
+def find_start_codons(sequence: str, frame: Optional[int] = None) -> list[int]:
+    """
+    Find the positions of all ATG start codons in a DNA sequence.
+    
+    Every offset is read as a 6-bit codon index (two bits per base), so
+    each candidate is one integer compare instead of a substring check.
+    
+    Args:
+        sequence: DNA sequence string (case-insensitive)
+        frame: Only report codons in this reading frame (0, 1 or 2), or
+            all frames if None
         
-        # Track ORF (Open Reading Frame)
-        if amino_acid == "M":
-            in_orf = True
-        elif amino_acid == "*":
-            in_orf = False
-            
-        if in_orf:
-            orf_translation.append(amino_acid)
-    
-    return "".join(full_translation), "".join(orf_translation)
+    Returns:
+        Sorted list of 0-based positions of the A of each ATG
+    """
+    raw = sequence.encode("ascii", errors="replace")
+    codes = _BASE_CODES[np.frombuffer(raw, dtype=np.uint8)]
+    if codes.size < 3:
+        return []
+    
+    first, second, third = codes[:-2], codes[1:-1], codes[2:]
+    codon_index = (first << 4) | (second << 2) | third
+    
+    # Codes 0-3 use two bits; the invalid code 4 sets the third bit
+    valid = (first | second | third) < _INVALID_BASE
+    positions = np.flatnonzero((codon_index == _START_CODON_INDEX) & valid)
+    
+    if frame is not None:
+        positions = positions[positions % 3 == frame]
+    return positions.tolist()
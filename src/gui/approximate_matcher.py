@@ -5,18 +5,36 @@ Provides a user interface for approximate string matching using
 Edit Distance (Levenshtein) and Hamming distance algorithms.
 """
 
+import hashlib
+import os
 import tkinter as tk
+from collections import Counter
+from typing import Any, Callable, Optional
 from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
 
-from .base import BaseApp, THEME
+from .base import BaseApp, THEME, launch
+from .tasks import read_fasta_sequence
 from ..core.approximate_matching import (
     edit_distance,
     edit_distance_with_trace,
     approximate_match,
     approximate_match_hamming,
-    ApproximateMatch
+    approximate_match_hamming_indexed,
+    ApproximateMatch,
+    TRACE_MAX_CELLS
 )
+from ..core.indexing import build_suffix_array
+
+# Longest loaded text that gets a background suffix array index
+# (construction takes roughly 0.5-1 s per Mbp)
+INDEX_MAX_LENGTH = 2_000_000
+
+
+def _build_index(text: str):
+    """Return the suffix array of text; runs on a worker."""
+    _, suffix_array = build_suffix_array(text)
+    return suffix_array
 
 
 class ApproximateMatcherApp(BaseApp):
@@ -25,6 +43,10 @@ class ApproximateMatcherApp(BaseApp):
     def __init__(self, root: tk.Tk):
         super().__init__(root, "Approximate Pattern Matching", width=900, height=700)
         self.dna_file = None
+        # Suffix arrays of loaded texts, keyed by a digest of the text
+        self._index_cache: dict = {}
+        # Key of the most recently loaded text; only its index is kept
+        self._index_key: Optional[bytes] = None
         self._create_widgets()
     
     def _create_widgets(self):
@@ -200,13 +222,50 @@ class ApproximateMatcherApp(BaseApp):
         """Load sequence from FASTA file."""
         file_path = self.choose_file("Select FASTA File")
         
-        if file_path:
-            sequence = self.read_fasta_file(file_path)
-            if sequence:
-                self.seq1_entry.delete(0, tk.END)
-                self.seq1_entry.insert(0, sequence.upper())
-                filename = file_path.split('/')[-1].split('\\')[-1]
-                self.file1_label.config(text=f"Loaded: {filename}")
+        if not file_path:
+            return
+        
+        # Read on a worker so large genomes don't freeze the UI
+        self.file1_button.config(state='disabled')
+        self.file1_label.config(text="Loading...")
+        
+        def on_loaded(sequence, error):
+            self.file1_button.config(state='normal')
+            if error is not None:
+                self.file1_label.config(text="")
+                self.show_read_error(file_path, error)
+                return
+            
+            self.seq1_entry.delete(0, tk.END)
+            self.seq1_entry.insert(0, sequence)
+            filename = os.path.basename(file_path)
+            self.file1_label.config(text=f"Loaded: {filename}")
+            self._build_index_async(sequence)
+        
+        self.run_in_background(read_fasta_sequence, on_loaded, file_path)
+    
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        """Return the index cache key for a text."""
+        return hashlib.blake2b(text.encode('utf-8')).digest()
+    
+    def _build_index_async(self, text: str):
+        """Build a suffix array for text in the background."""
+        if len(text) > INDEX_MAX_LENGTH:
+            return
+        
+        key = self._text_key(text)
+        self._index_key = key
+        if key in self._index_cache:
+            return
+        
+        def on_built(suffix_array, error):
+            # A slower build for an earlier file must not replace the
+            # index of the text loaded since
+            if error is None and key == self._index_key:
+                self._index_cache = {key: suffix_array}
+        
+        self.run_in_background(_build_index, on_built, text)
     
     def _calculate(self):
         """Perform calculation based on mode."""
@@ -258,14 +317,19 @@ class ApproximateMatcherApp(BaseApp):
                     f"Mismatches at positions:\n"
                 )
                 mismatches = [(i, seq1[i], seq2[i]) for i in range(len(seq1)) if seq1[i] != seq2[i]]
-                for pos, c1, c2 in mismatches[:20]:  # Show first 20
-                    self.result_text.insert(tk.END, f"  Position {pos}: '{c1}' → '{c2}'\n")
-                if len(mismatches) > 20:
-                    self.result_text.insert(tk.END, f"  ... and {len(mismatches) - 20} more\n")
+                self._render_truncated(
+                    mismatches, 20,
+                    lambda i, m: f"  Position {m[0]}: '{m[1]}' → '{m[2]}'\n",
+                    "  ... and {} more\n"
+                )
                 return
         
-        # Edit Distance calculation
-        distance, operations = edit_distance_with_trace(seq1, seq2)
+        # Edit Distance calculation; the full traceback needs the whole
+        # DP matrix, so only build it when that is cheap
+        if len(seq1) * len(seq2) < TRACE_MAX_CELLS:
+            distance, operations = edit_distance_with_trace(seq1, seq2)
+        else:
+            distance, operations = edit_distance(seq1, seq2), None
         
         self.result_text.insert(tk.END, 
             f"═══ Edit Distance (Levenshtein) Analysis ═══\n\n"
@@ -281,13 +345,14 @@ class ApproximateMatcherApp(BaseApp):
         similarity = (1 - distance / max_len) * 100 if max_len > 0 else 100
         self.result_text.insert(tk.END, f"Similarity: {similarity:.2f}%\n\n")
         
-        # Operation summary
-        op_counts = {
-            'M': operations.count('M'),
-            'S': operations.count('S'),
-            'I': operations.count('I'),
-            'D': operations.count('D')
-        }
+        if operations is None:
+            self.result_text.insert(tk.END,
+                "Operations Summary: not shown for long sequences\n"
+            )
+            return
+        
+        # Operation summary (single pass over the trace)
+        op_counts = Counter(operations)
         
         self.result_text.insert(tk.END, 
             f"Operations Summary:\n"
@@ -315,21 +380,27 @@ class ApproximateMatcherApp(BaseApp):
         self.root.update()  # Update UI during search
         
         if algorithm == "hamming":
-            positions = approximate_match_hamming(text, pattern, max_dist)
+            suffix_array = self._index_cache.get(self._text_key(text))
+            if suffix_array is not None:
+                positions = approximate_match_hamming_indexed(
+                    text, pattern, max_dist, suffix_array
+                )
+            else:
+                positions = approximate_match_hamming(text, pattern, max_dist)
             if positions:
                 self.result_text.insert(tk.END, 
                     f"✅ Found {len(positions)} approximate match(es):\n\n"
                 )
-                for i, pos in enumerate(positions[:50], 1):
+                
+                def render_position(i, pos):
                     matched = text[pos:pos + len(pattern)]
                     mismatches = sum(c1 != c2 for c1, c2 in zip(pattern, matched))
-                    self.result_text.insert(tk.END, 
-                        f"  {i}. Position {pos}: {matched} (mismatches: {mismatches})\n"
-                    )
-                if len(positions) > 50:
-                    self.result_text.insert(tk.END, 
-                        f"\n  ... and {len(positions) - 50} more matches\n"
-                    )
+                    return f"  {i}. Position {pos}: {matched} (mismatches: {mismatches})\n"
+                
+                self._render_truncated(
+                    positions, 50, render_position,
+                    "\n  ... and {} more matches\n"
+                )
             else:
                 self.result_text.insert(tk.END, 
                     "❌ No approximate matches found within the specified distance.\n"
@@ -340,21 +411,38 @@ class ApproximateMatcherApp(BaseApp):
                 self.result_text.insert(tk.END, 
                     f"✅ Found {len(matches)} approximate match(es):\n\n"
                 )
-                for i, match in enumerate(matches[:50], 1):
-                    self.result_text.insert(tk.END, 
+                self._render_truncated(
+                    matches, 50,
+                    lambda i, match: (
                         f"  {i}. Position {match.position}:\n"
                         f"      Matched: {match.matched_text}\n"
                         f"      Edit Distance: {match.distance}\n\n"
-                    )
-                if len(matches) > 50:
-                    self.result_text.insert(tk.END, 
-                        f"  ... and {len(matches) - 50} more matches\n"
-                    )
+                    ),
+                    "  ... and {} more matches\n"
+                )
             else:
                 self.result_text.insert(tk.END, 
                     "❌ No approximate matches found within the specified distance.\n"
                 )
     
+    def _render_truncated(self, items: list, cap: int,
+                          render_fn: Callable[[int, Any], str], tail_fmt: str):
+        """
+        Insert the first cap items into the results, followed by a tail
+        line with the number of items left out.
+        
+        Args:
+            items: Items to display
+            cap: Maximum number of items to render
+            render_fn: Returns the display text for (1-based index, item)
+            tail_fmt: Format string for the remaining count, e.g. "... and {} more"
+        """
+        total = len(items)
+        rows = [render_fn(i, item) for i, item in enumerate(items[:cap], 1)]
+        if total > cap:
+            rows.append(tail_fmt.format(total - cap))
+        self.result_text.insert(tk.END, "".join(rows))
+    
     def _clear(self):
         """Clear all inputs and results."""
         self.seq1_entry.delete(0, tk.END)
@@ -363,11 +451,9 @@ class ApproximateMatcherApp(BaseApp):
         self.file1_label.config(text="")
 
 
-def run():
-    """Run the Approximate Matcher application."""
-    root = tk.Tk()
-    app = ApproximateMatcherApp(root)
-    root.mainloop()
+def run(parent: Optional[tk.Misc] = None) -> ApproximateMatcherApp:
+    """Run the Approximate Matcher application, in a Toplevel of parent if given."""
+    return launch(ApproximateMatcherApp, parent)
 
 
 if __name__ == "__main__":
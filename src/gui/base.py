@@ -7,6 +7,8 @@ from tkinter import filedialog, messagebox
 from typing import Optional, Callable
 import os
 
+from .tasks import AppTaskMixin
+
 
 # Theme configuration
 THEME = {
@@ -23,7 +25,7 @@ THEME = {
 }
 
 
-class BaseApp:
+class BaseApp(AppTaskMixin):
     """Base class for all GUI applications with common functionality."""
     
     def __init__(self, root: tk.Tk, title: str, width: int = None, height: int = None):
@@ -169,6 +171,29 @@ class BaseApp:
             return file_path
         return None
     
+    def save_file(self, title: str = "Save File",
+                  filetypes: list = None,
+                  default_ext: str = None) -> Optional[str]:
+        """
+        Open a save file dialog.
+        
+        Args:
+            title: Dialog title
+            filetypes: List of (description, pattern) tuples
+            default_ext: Default file extension
+            
+        Returns:
+            Selected file path or None if cancelled
+        """
+        filetypes = filetypes or [("All files", "*.*")]
+        
+        file_path = filedialog.asksaveasfilename(
+            title=title,
+            filetypes=filetypes,
+            defaultextension=default_ext
+        )
+        return file_path or None
+    
     def show_error(self, title: str, message: str):
         """Show an error message box."""
         messagebox.showerror(title, message)
@@ -180,33 +205,28 @@ class BaseApp:
     def show_info(self, title: str, message: str):
         """Show an info message box."""
         messagebox.showinfo(title, message)
+
+
+def launch(app_class: type, parent: Optional[tk.Misc] = None) -> "BaseApp":
+    """
+    Open an application window.
     
-    def read_fasta_file(self, file_path: str) -> Optional[str]:
-        """
-        Read a FASTA file and return the sequence.
+    Without a parent a new Tk root is created and its event loop runs
+    until the window is closed. With a parent the app opens in a
+    Toplevel that shares the parent's Tcl interpreter and event loop,
+    and this returns immediately.
+    
+    Args:
+        app_class: BaseApp subclass to instantiate
+        parent: Existing widget to attach the window to (optional)
         
-        Args:
-            file_path: Path to FASTA file
-            
-        Returns:
-            Sequence string or None if error
-        """
-        try:
-            with open(file_path, 'r') as file:
-                lines = [line.strip() for line in file.readlines()]
-                
-                # Find sequence lines (skip headers starting with >)
-                sequence_lines = [line for line in lines if line and not line.startswith('>')]
-                
-                if sequence_lines:
-                    return "".join(sequence_lines)
-                else:
-                    self.show_error("Error", "No sequence found in file")
-                    return None
-                    
-        except FileNotFoundError:
-            self.show_error("Error", f"File not found: {file_path}")
-            return None
-        except Exception as e:
-            self.show_error("Error", f"Error reading file: {e}")
-            return None
+    Returns:
+        The application instance
+    """
+    if parent is not None:
+        return app_class(tk.Toplevel(parent))
+    
+    root = tk.Tk()
+    app = app_class(root)
+    root.mainloop()
+    return app
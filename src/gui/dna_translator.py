@@ -4,9 +4,10 @@ DNA to Protein Translator GUI.
 
 import tkinter as tk
 from tkinter import messagebox
+from typing import Optional
 
-from .base import BaseApp
-from ..core.sequence_operations import translate_dna_to_protein
+from .base import BaseApp, launch
+from ..core.sequence_operations import is_valid_dna, translate_dna_to_protein
 
 
 class DNATranslatorApp(BaseApp):
@@ -77,8 +78,7 @@ class DNATranslatorApp(BaseApp):
             return
         
         # Validate sequence
-        valid_chars = set("ACGT")
-        if not all(c in valid_chars for c in sequence):
+        if not is_valid_dna(sequence):
             self.show_error("Error", "Invalid DNA sequence. Use only A, C, G, T.")
             return
         
@@ -104,11 +104,9 @@ class DNATranslatorApp(BaseApp):
         self.result_var.set("")
 
 
-def run():
-    """Run the DNA Translator application."""
-    root = tk.Tk()
-    app = DNATranslatorApp(root)
-    root.mainloop()
+def run(parent: Optional[tk.Misc] = None) -> DNATranslatorApp:
+    """Run the DNA Translator application, in a Toplevel of parent if given."""
+    return launch(DNATranslatorApp, parent)
 
 
 if __name__ == "__main__":
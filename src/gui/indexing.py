@@ -2,10 +2,57 @@
 Indexing and Pattern Query GUI.
 """
 
+import os
+import string
 import tkinter as tk
+from functools import lru_cache
+from typing import Optional
 
-from .base import BaseApp
+from .base import BaseApp, launch
+from ..core.fasta_operations import read_sequence_bytes
 from ..core.indexing import build_sorted_index, query_index
+from ..core.indexing_fast import build_packed_index, query_packed_index, pack_kmer
+from ..core.pattern_matching import naive_match_all
+
+
+# Pattern normalization: uppercase and drop whitespace in one translate
+_UPPER = bytes.maketrans(
+    string.ascii_lowercase.encode('ascii'),
+    string.ascii_uppercase.encode('ascii')
+)
+_WHITESPACE = b' \t\r\n'
+
+
+# All caches are keyed on the file's mtime, so editing the file
+# invalidates them automatically
+
+@lru_cache(maxsize=2)
+def _load_sequence(path: str, mtime_ns: int) -> bytes:
+    """Read the file's sequence as uppercase bytes."""
+    return read_sequence_bytes(path)
+
+
+@lru_cache(maxsize=2)
+def _index_for(path: str, mtime_ns: int, k: int):
+    """Build the k-mer index, packed unless k is longer than 32 bases."""
+    sequence = _load_sequence(path, mtime_ns)
+    packed_index = build_packed_index(sequence, k)
+    if packed_index is not None:
+        return packed_index
+    return build_sorted_index(sequence, k)
+
+
+@lru_cache(maxsize=256)
+def _query(path: str, mtime_ns: int, pattern: bytes) -> tuple[int, ...]:
+    """Return the positions of pattern in the file's sequence."""
+    index = _index_for(path, mtime_ns, len(pattern))
+    if isinstance(index, tuple):
+        if pack_kmer(pattern) is None:
+            # The packed index skips windows with ambiguous bases, so a
+            # pattern containing them is matched directly
+            return tuple(naive_match_all(_load_sequence(path, mtime_ns), pattern))
+        return tuple(query_packed_index(pattern, index))
+    return tuple(query_index(_load_sequence(path, mtime_ns), pattern, index))
 
 
 class IndexingApp(BaseApp):
@@ -51,12 +98,15 @@ class IndexingApp(BaseApp):
         
         if file_path:
             self.dna_file = file_path
-            filename = file_path.split('/')[-1].split('\\')[-1]
+            filename = os.path.basename(file_path)
             self.file_label.config(text=f"Selected: {filename}")
     
     def _query_pattern(self):
         """Query the index for pattern occurrences."""
-        pattern = self.pattern_entry.get().strip().upper()
+        pattern_bytes = self.pattern_entry.get().encode('utf-8').translate(
+            _UPPER, _WHITESPACE
+        )
+        pattern = pattern_bytes.decode('utf-8')
         
         if not pattern:
             self.result_label.config(text="Please enter a pattern")
@@ -66,32 +116,32 @@ class IndexingApp(BaseApp):
             self.result_label.config(text="Please select a DNA file first")
             return
         
-        sequence = self.read_fasta_file(self.dna_file)
+        try:
+            mtime_ns = os.stat(self.dna_file).st_mtime_ns
+            if not _load_sequence(self.dna_file, mtime_ns):
+                self.show_error("Error", "No sequence found in file")
+                return
+            offsets = list(_query(self.dna_file, mtime_ns, pattern_bytes))
+        except FileNotFoundError:
+            self.show_error("Error", f"File not found: {self.dna_file}")
+            return
+        except Exception as e:
+            self.show_error("Error", f"Error reading file: {e}")
+            return
         
-        if sequence:
-            sequence = sequence.upper()
-            
-            # Build index with pattern length
-            index = build_sorted_index(sequence, len(pattern))
-            
-            # Query for pattern
-            offsets = query_index(sequence, pattern, index)
-            
-            if offsets:
-                self.result_label.config(
-                    text=f"Pattern '{pattern}' found at positions: {offsets}"
-                )
-            else:
-                self.result_label.config(
-                    text=f"Pattern '{pattern}' not found in sequence"
-                )
-
-
-def run():
-    """Run the Indexing application."""
-    root = tk.Tk()
-    app = IndexingApp(root)
-    root.mainloop()
+        if offsets:
+            self.result_label.config(
+                text=f"Pattern '{pattern}' found at positions: {offsets}"
+            )
+        else:
+            self.result_label.config(
+                text=f"Pattern '{pattern}' not found in sequence"
+            )
+
+
+def run(parent: Optional[tk.Misc] = None) -> IndexingApp:
+    """Run the Indexing application, in a Toplevel of parent if given."""
+    return launch(IndexingApp, parent)
 
 
 if __name__ == "__main__":
@@ -6,10 +6,15 @@ with single-window navigation, smooth transitions, and premium design aesthetics
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Tuple
+from collections import OrderedDict
 import os
+import weakref
+
+from .tasks import AppTaskMixin
 
 
 # Modern Theme Configuration
@@ -53,8 +58,52 @@ MODERN_THEME = {
     'border_radius': 8,
 }
 
+# Button color schemes for ModernApp.create_button
+_BUTTON_STYLES = {
+    'primary': {
+        'bg': MODERN_THEME['accent_primary'],
+        'fg': MODERN_THEME['bg_primary'],
+        'active_bg': '#00b8e6'
+    },
+    'secondary': {
+        'bg': MODERN_THEME['bg_card'],
+        'fg': MODERN_THEME['text_primary'],
+        'active_bg': MODERN_THEME['bg_hover']
+    },
+    'ghost': {
+        'bg': MODERN_THEME['bg_secondary'],
+        'fg': MODERN_THEME['text_secondary'],
+        'active_bg': MODERN_THEME['bg_card']
+    },
+    'danger': {
+        'bg': MODERN_THEME['error'],
+        'fg': MODERN_THEME['text_primary'],
+        'active_bg': '#cc0058'
+    },
+    'success': {
+        'bg': MODERN_THEME['success'],
+        'fg': MODERN_THEME['bg_primary'],
+        'active_bg': '#00cc6e'
+    }
+}
+
+
+# Tk roots whose ttk styles have been configured. ttk styles belong to the
+# Tcl interpreter, so each root needs configuring exactly once.
+_STYLED_ROOTS = weakref.WeakSet()
+
 
-class ModernApp:
+def _on_button_enter(event):
+    """Highlight a ModernApp button under the pointer."""
+    event.widget.configure(bg=event.widget._hover_bg)
+
+
+def _on_button_leave(event):
+    """Restore a ModernApp button's resting color."""
+    event.widget.configure(bg=event.widget._rest_bg)
+
+
+class ModernApp(AppTaskMixin):
     """
     Modern single-window application framework with page navigation.
     
@@ -75,7 +124,21 @@ class ModernApp:
         # Navigation stack
         self.page_stack = []
         self.current_page = None
-        self.pages: Dict[str, tk.Frame] = {}
+        
+        # Built pages keyed by (page_name, key_args), least recently shown
+        # first; beyond max_cached_pages the oldest page not on the stack
+        # is destroyed and rebuilt on demand
+        self.pages: "OrderedDict[Tuple[str, tuple], tk.Frame]" = OrderedDict()
+        self.max_cached_pages = 4
+        
+        # One canonical key object per distinct page, see navigate_to()
+        self._page_keys: Dict[Tuple[str, tuple], Tuple[str, tuple]] = {}
+        
+        # Named fonts shared by all widgets, see _font()
+        self._fonts: Dict[tuple, tkfont.Font] = {}
+        
+        # Parent background colors already read back from Tk
+        self._bg_cache = weakref.WeakKeyDictionary()
         
         # Configure styles
         self._configure_styles()
@@ -100,7 +163,11 @@ class ModernApp:
             pass
     
     def _configure_styles(self):
-        """Configure ttk styles for modern look."""
+        """Configure ttk styles for modern look (once per Tk root)."""
+        if self.root in _STYLED_ROOTS:
+            return
+        _STYLED_ROOTS.add(self.root)
+        
         style = ttk.Style()
         
         # Configure Treeview
@@ -130,28 +197,78 @@ class ModernApp:
             arrowcolor=MODERN_THEME['accent_primary']
         )
     
-    def navigate_to(self, page_name: str, page_builder: Callable = None):
+    def _font(self, size: str = 'md', bold: bool = False,
+              mono: bool = False) -> tkfont.Font:
+        """
+        Get a shared Font object for a theme size and weight.
+        
+        Widgets given a Font refer to one named Tk font instead of each
+        parsing a (family, size, weight) tuple.
+        
+        Args:
+            size: 'sm', 'md', 'lg', 'xl', 'title'
+            bold: Whether to use bold weight
+            mono: Whether to use the monospace family
+            
+        Returns:
+            Cached Font object
+        """
+        key = (size, bold, mono)
+        font = self._fonts.get(key)
+        if font is None:
+            font = tkfont.Font(
+                root=self.root,
+                family=MODERN_THEME['font_mono' if mono else 'font_family'],
+                size=MODERN_THEME[f'font_size_{size}'],
+                weight='bold' if bold else 'normal'
+            )
+            self._fonts[key] = font
+        return font
+    
+    def navigate_to(self, page_name: str, page_builder: Callable = None,
+                    *, key_args: tuple = ()):
         """
         Navigate to a page, creating it if necessary.
         
+        Navigations with the same page_name and key_args share one page,
+        whichever entry point they come from.
+        
         Args:
-            page_name: Unique identifier for the page
+            page_name: Identifier for the page
             page_builder: Function to build the page content
+            key_args: Hashable arguments distinguishing variants of the page
         """
+        # Intern the key so the stack and page table share one object per
+        # page and lookups compare by identity
+        key = (page_name, tuple(key_args))
+        key = self._page_keys.setdefault(key, key)
+        
         # Hide current page
         if self.current_page:
             self.page_stack.append(self.current_page)
             self.pages[self.current_page].pack_forget()
         
         # Create or show page
-        if page_name not in self.pages:
+        if key not in self.pages:
+            self._evict_pages()
             frame = tk.Frame(self.main_container, bg=MODERN_THEME['bg_primary'])
-            self.pages[page_name] = frame
+            self.pages[key] = frame
             if page_builder:
                 page_builder(frame)
         
-        self.pages[page_name].pack(fill='both', expand=True)
-        self.current_page = page_name
+        self.pages.move_to_end(key)
+        self.pages[key].pack(fill='both', expand=True)
+        self.current_page = key
+    
+    def _evict_pages(self):
+        """Destroy least recently shown pages to make room for a new one."""
+        for key in list(self.pages):
+            if len(self.pages) < self.max_cached_pages:
+                break
+            # Pages reachable with Back must stay alive
+            if key == self.current_page or key in self.page_stack:
+                continue
+            self.pages.pop(key).destroy()
     
     def go_back(self):
         """Navigate back to the previous page."""
@@ -162,6 +279,7 @@ class ModernApp:
             
             # Show previous page
             previous = self.page_stack.pop()
+            self.pages.move_to_end(previous)
             self.pages[previous].pack(fill='both', expand=True)
             self.current_page = previous
     
@@ -193,7 +311,7 @@ class ModernApp:
         title_label = tk.Label(
             header,
             text=title,
-            font=(MODERN_THEME['font_family'], MODERN_THEME['font_size_xl'], 'bold'),
+            font=self._font('xl', bold=True),
             bg=MODERN_THEME['bg_secondary'],
             fg=MODERN_THEME['accent_primary']
         )
@@ -218,35 +336,7 @@ class ModernApp:
         Returns:
             Styled Button widget
         """
-        styles = {
-            'primary': {
-                'bg': MODERN_THEME['accent_primary'],
-                'fg': MODERN_THEME['bg_primary'],
-                'active_bg': '#00b8e6'
-            },
-            'secondary': {
-                'bg': MODERN_THEME['bg_card'],
-                'fg': MODERN_THEME['text_primary'],
-                'active_bg': MODERN_THEME['bg_hover']
-            },
-            'ghost': {
-                'bg': MODERN_THEME['bg_secondary'],
-                'fg': MODERN_THEME['text_secondary'],
-                'active_bg': MODERN_THEME['bg_card']
-            },
-            'danger': {
-                'bg': MODERN_THEME['error'],
-                'fg': MODERN_THEME['text_primary'],
-                'active_bg': '#cc0058'
-            },
-            'success': {
-                'bg': MODERN_THEME['success'],
-                'fg': MODERN_THEME['bg_primary'],
-                'active_bg': '#00cc6e'
-            }
-        }
-        
-        btn_style = styles.get(style, styles['primary'])
+        btn_style = _BUTTON_STYLES.get(style, _BUTTON_STYLES['primary'])
         display_text = f"{icon} {text}" if icon else text
         
         btn = tk.Button(
@@ -257,7 +347,7 @@ class ModernApp:
             fg=btn_style['fg'],
             activebackground=btn_style['active_bg'],
             activeforeground=btn_style['fg'],
-            font=(MODERN_THEME['font_family'], MODERN_THEME['font_size_md'], 'bold'),
+            font=self._font('md', bold=True),
             relief='flat',
             cursor='hand2',
             padx=20,
@@ -266,15 +356,12 @@ class ModernApp:
             bd=0
         )
         
-        # Hover effects
-        def on_enter(e):
-            btn.configure(bg=btn_style['active_bg'])
-        
-        def on_leave(e):
-            btn.configure(bg=btn_style['bg'])
-        
-        btn.bind('<Enter>', on_enter)
-        btn.bind('<Leave>', on_leave)
+        # Hover effects; the colors live on the widget so every button can
+        # share the same two module-level handlers
+        btn._hover_bg = btn_style['active_bg']
+        btn._rest_bg = btn_style['bg']
+        btn.bind('<Enter>', _on_button_enter)
+        btn.bind('<Leave>', _on_button_leave)
         
         return btn
     
@@ -304,7 +391,7 @@ class ModernApp:
             title_label = tk.Label(
                 card,
                 text=title,
-                font=(MODERN_THEME['font_family'], MODERN_THEME['font_size_lg'], 'bold'),
+                font=self._font('lg', bold=True),
                 bg=MODERN_THEME['bg_card'],
                 fg=MODERN_THEME['accent_primary']
             )
@@ -314,7 +401,7 @@ class ModernApp:
     
     def create_label(self, parent: tk.Widget, text: str, 
                      size: str = 'md', color: str = None,
-                     bold: bool = False) -> tk.Label:
+                     bold: bool = False, bg: str = None) -> tk.Label:
         """
         Create a modern label.
         
@@ -324,32 +411,29 @@ class ModernApp:
             size: 'sm', 'md', 'lg', 'xl', 'title'
             color: Text color (or use theme default)
             bold: Whether to use bold font
+            bg: Background color (defaults to the parent's background)
             
         Returns:
             Label widget
         """
-        sizes = {
-            'sm': MODERN_THEME['font_size_sm'],
-            'md': MODERN_THEME['font_size_md'],
-            'lg': MODERN_THEME['font_size_lg'],
-            'xl': MODERN_THEME['font_size_xl'],
-            'title': MODERN_THEME['font_size_title']
-        }
-        
-        font_size = sizes.get(size, sizes['md'])
-        font_weight = 'bold' if bold else 'normal'
+        if f'font_size_{size}' not in MODERN_THEME:
+            size = 'md'
         fg_color = color or MODERN_THEME['text_primary']
         
-        # Determine background based on parent
-        try:
-            bg_color = parent.cget('bg')
-        except:
-            bg_color = MODERN_THEME['bg_primary']
+        # Determine background based on parent, asking Tk only once
+        # per parent widget
+        bg_color = bg or self._bg_cache.get(parent)
+        if bg_color is None:
+            try:
+                bg_color = parent.cget('bg')
+            except:
+                bg_color = MODERN_THEME['bg_primary']
+            self._bg_cache[parent] = bg_color
         
         return tk.Label(
             parent,
             text=text,
-            font=(MODERN_THEME['font_family'], font_size, font_weight),
+            font=self._font(size, bold=bold),
             bg=bg_color,
             fg=fg_color
         )
@@ -370,7 +454,7 @@ class ModernApp:
         entry = tk.Entry(
             parent,
             width=width,
-            font=(MODERN_THEME['font_family'], MODERN_THEME['font_size_md']),
+            font=self._font('md'),
             bg=MODERN_THEME['bg_secondary'],
             fg=MODERN_THEME['text_primary'],
             insertbackground=MODERN_THEME['accent_primary'],
@@ -415,7 +499,7 @@ class ModernApp:
         text = ScrolledText(
             parent,
             height=height,
-            font=(MODERN_THEME['font_mono'], MODERN_THEME['font_size_md']),
+            font=self._font('md', mono=True),
             bg=MODERN_THEME['bg_secondary'],
             fg=MODERN_THEME['success'],
             insertbackground=MODERN_THEME['accent_primary'],
@@ -487,31 +571,3 @@ class ModernApp:
             messagebox.showwarning(title, message)
         else:
             messagebox.showinfo(title, message)
-    
-    def read_fasta_file(self, file_path: str) -> Optional[str]:
-        """
-        Read a FASTA file and return the sequence.
-        
-        Args:
-            file_path: Path to FASTA file
-            
-        Returns:
-            Sequence string or None if error
-        """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = [line.strip() for line in file.readlines()]
-                sequence_lines = [line for line in lines if line and not line.startswith('>')]
-                
-                if sequence_lines:
-                    return "".join(sequence_lines)
-                else:
-                    self.show_message("Error", "No sequence found in file", 'error')
-                    return None
-                    
-        except FileNotFoundError:
-            self.show_message("Error", f"File not found: {file_path}", 'error')
-            return None
-        except Exception as e:
-            self.show_message("Error", f"Error reading file: {e}", 'error')
-            return None
@@ -3,11 +3,19 @@ Overlap Detection GUI.
 """
 
 import tkinter as tk
+from typing import Optional
 
-from .base import BaseApp
+from .base import BaseApp, launch
 from ..core.sequence_analysis import compute_overlap
 
 
+def _format_overlap(overlap_len: int, overlap_seq: str) -> str:
+    """Format the result label text for an overlap check."""
+    if overlap_len > 0:
+        return f"Overlap found!\nLength: {overlap_len}\nSequence: {overlap_seq}"
+    return "No significant overlap found"
+
+
 class OverlapApp(BaseApp):
     """GUI application for detecting sequence overlaps."""
     
@@ -57,13 +65,7 @@ class OverlapApp(BaseApp):
             return
         
         overlap_len, overlap_seq = compute_overlap(seq1, seq2)
-        
-        if overlap_len > 0:
-            self.result_label.config(
-                text=f"Overlap found!\nLength: {overlap_len}\nSequence: {overlap_seq}"
-            )
-        else:
-            self.result_label.config(text="No significant overlap found")
+        self.result_label.config(text=_format_overlap(overlap_len, overlap_seq))
     
     def _clear(self):
         """Clear all inputs and results."""
@@ -72,11 +74,9 @@ class OverlapApp(BaseApp):
         self.result_label.config(text="")
 
 
-def run():
-    """Run the Overlap application."""
-    root = tk.Tk()
-    app = OverlapApp(root)
-    root.mainloop()
+def run(parent: Optional[tk.Misc] = None) -> OverlapApp:
+    """Run the Overlap application, in a Toplevel of parent if given."""
+    return launch(OverlapApp, parent)
 
 
 if __name__ == "__main__":
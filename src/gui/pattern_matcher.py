@@ -2,12 +2,27 @@
 Pattern Matching GUI Applications.
 """
 
+import os
 import tkinter as tk
+from typing import Callable, Optional
 
-from .base import BaseApp
+from .base import BaseApp, launch
+from .tasks import read_fasta_sequence
 from ..core.pattern_matching import naive_match, bad_character_match
 
 
+def _search_file(file_path: str, pattern: str, matcher: Callable[[str, str], int]) -> int:
+    """Read a FASTA file and return matcher's result; runs on a worker."""
+    return matcher(read_fasta_sequence(file_path), pattern)
+
+
+def _format_match(pattern: str, position: int) -> str:
+    """Format the result label text for a search result."""
+    if position >= 0:
+        return f"Pattern '{pattern}' found at position: {position}"
+    return f"Pattern '{pattern}' not found in sequence"
+
+
 class NaiveMatcherApp(BaseApp):
     """GUI application for naive pattern matching."""
     
@@ -51,7 +66,7 @@ class NaiveMatcherApp(BaseApp):
         
         if file_path:
             self.dna_file = file_path
-            filename = file_path.split('/')[-1].split('\\')[-1]
+            filename = os.path.basename(file_path)
             self.file_label.config(text=f"Selected: {filename}")
     
     def _match_sequence(self):
@@ -66,19 +81,20 @@ class NaiveMatcherApp(BaseApp):
             self.result_label.config(text="Please select a DNA file first")
             return
         
-        sequence = self.read_fasta_file(self.dna_file)
+        # Read and search on a worker so large genomes don't freeze the UI
+        file_path = self.dna_file
+        self.match_button.config(state='disabled')
+        self.result_label.config(text="Searching...")
+        
+        def on_done(position, error):
+            self.match_button.config(state='normal')
+            self.result_label.config(
+                text="" if error is not None else _format_match(pattern, position)
+            )
+            if error is not None:
+                self.show_read_error(file_path, error)
         
-        if sequence:
-            position = naive_match(sequence.upper(), pattern)
-            
-            if position >= 0:
-                self.result_label.config(
-                    text=f"Pattern '{pattern}' found at position: {position}"
-                )
-            else:
-                self.result_label.config(
-                    text=f"Pattern '{pattern}' not found in sequence"
-                )
+        self.run_in_background(_search_file, on_done, file_path, pattern, naive_match)
 
 
 class BadCharacterMatcherApp(BaseApp):
@@ -124,7 +140,7 @@ class BadCharacterMatcherApp(BaseApp):
         
         if file_path:
             self.dna_file = file_path
-            filename = file_path.split('/')[-1].split('\\')[-1]
+            filename = os.path.basename(file_path)
             self.file_label.config(text=f"Selected: {filename}")
     
     def _match_sequence(self):
@@ -139,33 +155,30 @@ class BadCharacterMatcherApp(BaseApp):
             self.result_label.config(text="Please select a DNA file first")
             return
         
-        sequence = self.read_fasta_file(self.dna_file)
-        
-        if sequence:
-            position = bad_character_match(sequence.upper(), pattern)
-            
-            if position >= 0:
-                self.result_label.config(
-                    text=f"Pattern '{pattern}' found at position: {position}"
-                )
-            else:
-                self.result_label.config(
-                    text=f"Pattern '{pattern}' not found in sequence"
-                )
-
-
-def run_naive():
-    """Run the Naive Matcher application."""
-    root = tk.Tk()
-    app = NaiveMatcherApp(root)
-    root.mainloop()
-
-
-def run_bad_character():
-    """Run the Bad Character Matcher application."""
-    root = tk.Tk()
-    app = BadCharacterMatcherApp(root)
-    root.mainloop()
+        # Read and search on a worker so large genomes don't freeze the UI
+        file_path = self.dna_file
+        self.match_button.config(state='disabled')
+        self.result_label.config(text="Searching...")
+        
+        def on_done(position, error):
+            self.match_button.config(state='normal')
+            self.result_label.config(
+                text="" if error is not None else _format_match(pattern, position)
+            )
+            if error is not None:
+                self.show_read_error(file_path, error)
+        
+        self.run_in_background(_search_file, on_done, file_path, pattern, bad_character_match)
+
+
+def run_naive(parent: Optional[tk.Misc] = None) -> NaiveMatcherApp:
+    """Run the Naive Matcher application, in a Toplevel of parent if given."""
+    return launch(NaiveMatcherApp, parent)
+
+
+def run_bad_character(parent: Optional[tk.Misc] = None) -> BadCharacterMatcherApp:
+    """Run the Bad Character Matcher application, in a Toplevel of parent if given."""
+    return launch(BadCharacterMatcherApp, parent)
 
 
 if __name__ == "__main__":
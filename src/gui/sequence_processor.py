@@ -3,10 +3,51 @@ FASTA Sequence Processor GUI.
 """
 
 import tkinter as tk
+from functools import lru_cache
 from tkinter.scrolledtext import ScrolledText
+from typing import Optional
 
-from .base import BaseApp
-from ..core.sequence_operations import gc_content, complement, reverse, reverse_complement
+from .base import BaseApp, launch
+from ..core.sequence_operations import is_valid_dna, complement, reverse
+
+
+# Characters of each sequence shown in the results box; Tk's Text widget
+# becomes unresponsive with multi-MB contents
+_PREVIEW_BYTES = 4096
+
+
+@lru_cache(maxsize=4)
+def _compute_all(sequence: str) -> tuple[float, str, str, str]:
+    """
+    Compute GC content, complement, reverse and reverse complement.
+    
+    Cached so processing the same sequence again is a lookup; the small
+    maxsize bounds how many large sequences are kept alive.
+    
+    Args:
+        sequence: Uppercase DNA sequence, already checked by is_valid_dna
+        
+    Returns:
+        Tuple of (gc, complement, reverse, reverse_complement)
+    """
+    # Validated input is pure ASCII, so GC is two C-level counts over the
+    # encoded bytes instead of a separate gc_content() pass
+    raw = sequence.encode('ascii')
+    gc = (raw.count(b'G') + raw.count(b'C')) / len(raw)
+    
+    # The reverse complement is just the complement reversed
+    comp = complement(sequence)
+    return gc, comp, reverse(sequence), reverse(comp)
+
+
+def _preview(title: str, sequence: str) -> str:
+    """Format a titled sequence, truncated to _PREVIEW_BYTES characters."""
+    if len(sequence) <= _PREVIEW_BYTES:
+        return f"{title}:\n{sequence}"
+    return (
+        f"{title} (first {_PREVIEW_BYTES:,} of {len(sequence):,}):\n"
+        f"{sequence[:_PREVIEW_BYTES]}..."
+    )
 
 
 class SequenceProcessorApp(BaseApp):
@@ -14,6 +55,7 @@ class SequenceProcessorApp(BaseApp):
     
     def __init__(self, root: tk.Tk):
         super().__init__(root, "DNA Sequence Processor", height=700)
+        self._last_results = None  # (sequence, gc, comp, rev, rev_comp)
         self._create_widgets()
     
     def _create_widgets(self):
@@ -45,6 +87,12 @@ class SequenceProcessorApp(BaseApp):
         )
         self.clear_button.pack(pady=10)
         
+        # Save button (the results box only shows a preview)
+        self.save_button = self.create_button(
+            self.root, "Save Full Results", self._save_results
+        )
+        self.save_button.pack(pady=10)
+        
         # Results display
         self.result_text = ScrolledText(
             self.root,
@@ -53,7 +101,8 @@ class SequenceProcessorApp(BaseApp):
             height=20,
             font=('Arial', 12),
             bg='#2C3E50',
-            fg='white'
+            fg='white',
+            state='disabled'
         )
         self.result_text.pack(padx=20, pady=10)
     
@@ -63,7 +112,7 @@ class SequenceProcessorApp(BaseApp):
         
         if file_path:
             sequence = self.read_fasta_file(file_path)
-            if sequence:
+            if sequence and self._check_sequence(sequence):
                 self._display_results(sequence)
     
     def _process_sequence(self):
@@ -74,47 +123,78 @@ class SequenceProcessorApp(BaseApp):
             self.show_error("Error", "Please enter a valid DNA sequence.")
             return
         
-        # Validate sequence
-        valid_chars = set("ACGT")
-        if not all(c in valid_chars for c in sequence):
+        if self._check_sequence(sequence):
+            self._display_results(sequence)
+    
+    def _check_sequence(self, sequence: str) -> bool:
+        """Validate a sequence, showing an error dialog if it is invalid."""
+        if not is_valid_dna(sequence):
             self.show_error("Error", "Invalid DNA sequence. Use only A, C, G, T.")
-            return
-        
-        self._display_results(sequence)
+            return False
+        return True
     
     def _display_results(self, sequence: str):
         """Display processing results."""
         try:
-            gc = gc_content(sequence)
-            comp = complement(sequence)
-            rev = reverse(sequence)
-            rev_comp = reverse_complement(sequence)
+            gc, comp, rev, rev_comp = _compute_all(sequence)
             
             results = (
-                f"Original Sequence:\n{sequence}\n\n"
+                f"{_preview('Original Sequence', sequence)}\n\n"
                 f"GC Content: {gc:.4f} ({gc*100:.2f}%)\n\n"
-                f"Complement:\n{comp}\n\n"
-                f"Reverse:\n{rev}\n\n"
-                f"Reverse Complement:\n{rev_comp}"
+                f"{_preview('Complement', comp)}\n\n"
+                f"{_preview('Reverse', rev)}\n\n"
+                f"{_preview('Reverse Complement', rev_comp)}"
             )
             
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, results)
+            self._set_result_text(results)
+            self._last_results = (sequence, gc, comp, rev, rev_comp)
             
         except ValueError as e:
             self.show_error("Processing Error", str(e))
     
+    def _save_results(self):
+        """Write the complete, untruncated results to a text file."""
+        if not self._last_results:
+            self.show_warning("Warning", "No results to save.")
+            return
+        
+        file_path = self.save_file(
+            "Save Results", [("Text files", "*.txt"), ("All files", "*.*")], ".txt"
+        )
+        if not file_path:
+            return
+        
+        sequence, gc, comp, rev, rev_comp = self._last_results
+        try:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(
+                    f"Original Sequence:\n{sequence}\n\n"
+                    f"GC Content: {gc:.4f} ({gc*100:.2f}%)\n\n"
+                    f"Complement:\n{comp}\n\n"
+                    f"Reverse:\n{rev}\n\n"
+                    f"Reverse Complement:\n{rev_comp}\n"
+                )
+        except OSError as e:
+            self.show_error("Error", f"Error saving file: {e}")
+    
     def _clear(self):
         """Clear all inputs and results."""
         self.input_entry.delete(0, tk.END)
-        self.result_text.delete(1.0, tk.END)
+        self._set_result_text("")
+        self._last_results = None
+    
+    def _set_result_text(self, text: str):
+        """Replace the results box contents in one read-only update."""
+        self.result_text.configure(state='normal')
+        self.result_text.delete('1.0', tk.END)
+        self.result_text.insert('1.0', text)
+        self.result_text.see('1.0')
+        self.result_text.configure(state='disabled')
 
 
-def run():
-    """Run the Sequence Processor application."""
-    root = tk.Tk()
-    app = SequenceProcessorApp(root)
-    root.mainloop()
+def run(parent: Optional[tk.Misc] = None) -> SequenceProcessorApp:
+    """Run the Sequence Processor application, in a Toplevel of parent if given."""
+    return launch(SequenceProcessorApp, parent)
 
 
 if __name__ == "__main__":
@@ -2,18 +2,91 @@
 Suffix Array Generator GUI.
 """
 
+import io
 import tkinter as tk
 from tkinter import scrolledtext
+from typing import Optional
 
-from .base import BaseApp
+from .base import BaseApp, launch
 from ..core.indexing import build_suffix_array
 
+# Rows shown from each end of the table; the rest is streamed on request
+HEAD_ROWS = 500
+TAIL_ROWS = 500
+SHOW_ALL_CHUNK_ROWS = 1000
+SUFFIX_DISPLAY_WIDTH = 25
+
+_ROW_FORMAT = "{:<30} {:<10} {:<10}\n".format
+
+
+def _format_rows(text: str, suffix_array, start: int, stop: int) -> str:
+    """
+    Format rows start..stop of a suffix array as table lines.
+    
+    Args:
+        text: Text the suffix array was built for
+        suffix_array: Sorted suffix start positions
+        start: First rank to format
+        stop: Rank after the last one to format
+        
+    Returns:
+        Formatted rows, one line per suffix
+    """
+    buf = io.StringIO()
+    write = buf.write
+    
+    # Slice only the displayed prefix of each suffix
+    width = SUFFIX_DISPLAY_WIDTH
+    n = len(text)
+    for rank, pos in enumerate(suffix_array[start:stop].tolist(), start):
+        display_suffix = text[pos:pos + width]
+        if n - pos > width:
+            display_suffix += "..."
+        write(_ROW_FORMAT(display_suffix, pos, rank))
+    
+    return buf.getvalue()
+
+
+def _format_suffix_array(text: str) -> tuple:
+    """
+    Build the suffix array of text and format the ends of its table.
+    
+    Runs on a worker thread; touches no widgets.
+    
+    Args:
+        text: Text to build the suffix array for
+        
+    Returns:
+        Tuple of (suffix_array, head, tail): head is the header plus the
+        first HEAD_ROWS rows, tail the last TAIL_ROWS rows (empty when
+        the whole table fits in head)
+    """
+    _, suffix_array = build_suffix_array(text)
+    n = len(suffix_array)
+    
+    rule = "-" * 50 + "\n"
+    header = (
+        f"Input Text: {text}\nLength: {len(text)}\n\n"
+        "Suffix Array (sorted suffixes with ranks):\n"
+        + rule + _ROW_FORMAT("Suffix", "Position", "Rank") + rule
+    )
+    
+    if n <= HEAD_ROWS + TAIL_ROWS:
+        return suffix_array, header + _format_rows(text, suffix_array, 0, n), ""
+    
+    head = header + _format_rows(text, suffix_array, 0, HEAD_ROWS)
+    tail = _format_rows(text, suffix_array, n - TAIL_ROWS, n)
+    return suffix_array, head, tail
+
 
 class SuffixArrayApp(BaseApp):
     """GUI application for generating suffix arrays."""
     
     def __init__(self, root: tk.Tk):
         super().__init__(root, "Suffix Array Generator", height=600)
+        self._build_future = None
+        self._build_id = 0
+        self._hidden_rows = None
         self._create_widgets()
     
     def _create_widgets(self):
@@ -31,12 +104,26 @@ class SuffixArrayApp(BaseApp):
         )
         self.generate_button.pack(pady=10)
         
+        # Cancel button, enabled while a build is running
+        self.cancel_button = self.create_button(
+            self.root, "Cancel", self._cancel, danger=True
+        )
+        self.cancel_button.config(state="disabled")
+        self.cancel_button.pack(pady=10)
+        
         # Clear button
         self.clear_button = self.create_button(
             self.root, "Clear", self._clear, danger=True
         )
         self.clear_button.pack(pady=10)
         
+        # Show all button, enabled while middle rows are hidden
+        self.show_all_button = self.create_button(
+            self.root, "Show All Rows", self._show_all
+        )
+        self.show_all_button.config(state="disabled")
+        self.show_all_button.pack(pady=10)
+        
         # Results display
         self.result_text = scrolledtext.ScrolledText(
             self.root,
@@ -50,46 +137,115 @@ class SuffixArrayApp(BaseApp):
         self.result_text.pack(pady=10)
     
     def _generate_suffix_array(self):
-        """Generate and display the suffix array."""
+        """Build the suffix array on a worker thread and display it."""
         text = self.text_entry.get().strip()
         
         if not text:
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, "Please enter a text string")
+            self._show_result("Please enter a text string")
             return
         
-        suffix_ranks, suffix_table = build_suffix_array(text)
+        self._build_id += 1
+        build_id = self._build_id
         
-        # Format output
-        output_lines = [
-            f"Input Text: {text}",
-            f"Length: {len(text)}",
-            "",
-            "Suffix Array (sorted suffixes with ranks):",
-            "-" * 50,
-            f"{'Suffix':<30} {'Position':<10} {'Rank':<10}",
-            "-" * 50
-        ]
-        
-        for suffix, pos, rank in suffix_table:
-            # Truncate long suffixes for display
-            display_suffix = suffix[:25] + "..." if len(suffix) > 25 else suffix
-            output_lines.append(f"{display_suffix:<30} {pos:<10} {rank:<10}")
+        def on_done(result, error):
+            # Ignore builds that were cancelled or superseded
+            if build_id != self._build_id:
+                return
+            self._build_future = None
+            self._set_running(False)
+            if error is not None:
+                self._show_result(f"Error: {error}")
+                return
+            self._show_table(text, *result)
         
+        self._set_running(True)
+        self._show_result("Building suffix array...")
+        self._build_future = self.run_in_background(
+            _format_suffix_array, on_done, text
+        )
+    
+    def _cancel(self):
+        """Cancel the running build and discard its result."""
+        if self._build_future is not None:
+            self._build_future.cancel()
+            self._build_future = None
+        self._build_id += 1
+        self._set_running(False)
+        self._show_result("Cancelled")
+    
+    def _set_running(self, running: bool):
+        """Toggle the Generate and Cancel buttons for a running build."""
+        self.generate_button.config(state="disabled" if running else "normal")
+        self.cancel_button.config(state="normal" if running else "disabled")
+    
+    def _show_result(self, text: str):
+        """Replace the contents of the results box."""
+        self._hidden_rows = None
+        self.show_all_button.config(state="disabled")
         self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, "\n".join(output_lines))
+        self.result_text.insert(tk.END, text)
+    
+    def _show_table(self, text: str, suffix_array, head: str, tail: str):
+        """Display the table ends, marking where the hidden rows belong."""
+        self._show_result(head)
+        if not tail:
+            return
+        
+        # The mark stays in front of the "more rows" line and the tail
+        hidden = len(suffix_array) - HEAD_ROWS - TAIL_ROWS
+        self.result_text.mark_set("hidden_rows", "end-1c")
+        self.result_text.mark_gravity("hidden_rows", tk.LEFT)
+        self.result_text.insert(tk.END, f"…({hidden:,} more rows)…\n", "truncated")
+        self.result_text.insert(tk.END, tail)
+        
+        self._hidden_rows = (text, suffix_array)
+        self.show_all_button.config(state="normal")
+    
+    def _show_all(self):
+        """Replace the "more rows" line with the hidden rows, in chunks."""
+        if self._hidden_rows is None:
+            return
+        text, suffix_array = self._hidden_rows
+        self._hidden_rows = None
+        self.show_all_button.config(state="disabled")
+        
+        # Right gravity: each inserted chunk lands before the mark
+        self.result_text.delete("truncated.first", "truncated.last")
+        self.result_text.mark_gravity("hidden_rows", tk.RIGHT)
+        
+        stop = len(suffix_array) - TAIL_ROWS
+        self.root.after_idle(
+            self._append_rows, self._build_id, text, suffix_array, HEAD_ROWS, stop
+        )
+    
+    def _append_rows(self, build_id: int, text: str, suffix_array,
+                     start: int, stop: int):
+        """Insert one chunk of hidden rows and schedule the next one."""
+        # Stop streaming once the table has been replaced or cleared
+        if build_id != self._build_id:
+            return
+        
+        end = min(start + SHOW_ALL_CHUNK_ROWS, stop)
+        self.result_text.insert(
+            "hidden_rows", _format_rows(text, suffix_array, start, end)
+        )
+        if end < stop:
+            self.root.after_idle(
+                self._append_rows, build_id, text, suffix_array, end, stop
+            )
     
     def _clear(self):
         """Clear all inputs and results."""
+        if self._build_future is not None:
+            self._cancel()
+        self._build_id += 1
         self.text_entry.delete(0, tk.END)
-        self.result_text.delete(1.0, tk.END)
+        self._show_result("")
 
 
-def run():
-    """Run the Suffix Array application."""
-    root = tk.Tk()
-    app = SuffixArrayApp(root)
-    root.mainloop()
+def run(parent: Optional[tk.Misc] = None) -> SuffixArrayApp:
+    """Run the Suffix Array application, in a Toplevel of parent if given."""
+    return launch(SuffixArrayApp, parent)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+"""
+Background tasks and FASTA loading shared by the GUI application classes.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from tkinter import messagebox
+from typing import Optional, Callable
+import os
+
+from ..core.fasta_operations import read_sequence_bytes, FastaParseError
+
+
+@lru_cache(maxsize=8)
+def _read_fasta_cached(file_path: str, mtime_ns: int, size: int) -> str:
+    """Read an uppercased FASTA sequence; cached per file version."""
+    # Header skipping, whitespace removal and uppercasing all happen on
+    # the memory-mapped bytes; the text is decoded once at the end
+    sequence = read_sequence_bytes(file_path)
+    
+    if not sequence:
+        raise FastaParseError("No sequence found in file")
+    
+    return sequence.decode('utf-8')
+
+
+def read_fasta_sequence(file_path: str) -> str:
+    """
+    Read a FASTA file and return all sequence lines joined and uppercased.
+    
+    Unlike AppTaskMixin.read_fasta_file this shows no dialogs, so it is safe
+    to call from a worker thread. Results are cached until the file's
+    modification time or size changes, so repeated reads of the same file
+    skip the disk.
+    
+    Args:
+        file_path: Path to FASTA file
+        
+    Returns:
+        Uppercased sequence string
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        FastaParseError: If the file has no sequence lines
+    """
+    st = os.stat(file_path)
+    return _read_fasta_cached(file_path, st.st_mtime_ns, st.st_size)
+
+
+class AppTaskMixin:
+    """
+    Background work and FASTA loading shared by BaseApp and ModernApp.
+    
+    Expects the host class to set self.root to its Tk window.
+    """
+    
+    # Created on first use, so apps that never run a task own no threads
+    _executor: Optional[ThreadPoolExecutor] = None
+    
+    def run_in_background(self, func: Callable, on_done: Callable, *args):
+        """
+        Run func(*args) on a worker thread without blocking the event loop.
+        
+        The future is polled from the Tk thread; on_done(result, error) is
+        called there once it finishes, with error set to the raised
+        exception (or None on success). on_done is not called if the
+        future is cancelled.
+        
+        Args:
+            func: Function to run on the worker thread
+            on_done: Callback receiving (result, error)
+            *args: Arguments passed to func
+            
+        Returns:
+            The Future of the submitted call
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2)
+            self.root.protocol("WM_DELETE_WINDOW", self._close_window)
+        future = self._executor.submit(func, *args)
+        
+        def poll():
+            if future.cancelled():
+                return
+            if not future.done():
+                self.root.after(50, poll)
+                return
+            error = future.exception()
+            on_done(None if error else future.result(), error)
+        
+        self.root.after(50, poll)
+        return future
+    
+    def _close_window(self):
+        """Drop queued background work, then destroy the window."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self.root.destroy()
+    
+    def show_read_error(self, file_path: str, error: Exception):
+        """Show the error dialog for a failed FASTA read."""
+        if isinstance(error, FileNotFoundError):
+            messagebox.showerror("Error", f"File not found: {file_path}")
+        elif isinstance(error, FastaParseError):
+            messagebox.showerror("Error", str(error))
+        else:
+            messagebox.showerror("Error", f"Error reading file: {error}")
+    
+    def read_fasta_file(self, file_path: str) -> Optional[str]:
+        """
+        Read a FASTA file and return the sequence.
+        
+        Goes through read_fasta_sequence(), which caches per file version,
+        so reading the same file again does not touch the disk.
+        
+        Args:
+            file_path: Path to FASTA file
+            
+        Returns:
+            Uppercased sequence string or None if error
+        """
+        try:
+            return read_fasta_sequence(file_path)
+        except Exception as e:
+            self.show_read_error(file_path, e)
+            return None
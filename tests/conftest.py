@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration.
+
+Puts the repository root on sys.path once, so test modules can import
+src.* without per-file path setup.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -0,0 +1,71 @@
+"""
+Unit tests for approximate matching algorithms.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.core._fast_edit import _edit_distance_kernel
+from src.core.approximate_matching import (
+    edit_distance,
+    edit_distance_with_trace,
+    approximate_match_hamming,
+    approximate_match_hamming_indexed
+)
+from src.core.indexing import build_suffix_array_simple, build_suffix_array
+
+
+class TestEditDistance:
+    """Tests for edit distance calculation."""
+
+    def test_docstring_example(self):
+        assert edit_distance("ACGACGT", "TCGTACGT") == 2
+
+    def test_identical(self):
+        assert edit_distance("ACGT", "ACGT") == 0
+
+    def test_empty(self):
+        assert edit_distance("", "ACG") == 3
+        assert edit_distance("ACG", "") == 3
+
+    def test_symmetric(self):
+        assert edit_distance("GATTACA", "TACA") == edit_distance("TACA", "GATTACA")
+
+    def test_matches_trace(self):
+        pairs = [("kitten", "sitting"), ("AAAA", "AGAA"), ("ACGT", "TGCA")]
+        for x, y in pairs:
+            assert edit_distance(x, y) == edit_distance_with_trace(x, y)[0]
+
+    def test_kernel_matches_trace(self):
+        # Runs the undecorated kernel, so it is covered without Numba
+        rng = random.Random(0)
+        for _ in range(50):
+            x = "".join(rng.choices("ACGT", k=rng.randint(0, 30)))
+            y = "".join(rng.choices("ACGT", k=rng.randint(0, 30)))
+            a = np.frombuffer(x.encode("ascii"), dtype=np.uint8)
+            b = np.frombuffer(y.encode("ascii"), dtype=np.uint8)
+            assert _edit_distance_kernel(a, b) == edit_distance_with_trace(x, y)[0]
+
+
+class TestHammingIndexed:
+    """Tests for suffix-array backed Hamming matching."""
+
+    def test_matches_scan(self):
+        text = "ACGTTGCAACGTACGAACGT"
+        sa = build_suffix_array_simple(text)
+        for pattern, k in [("ACGT", 0), ("ACGT", 1), ("TTGCA", 2), ("AC", 3)]:
+            assert (approximate_match_hamming_indexed(text, pattern, k, sa)
+                    == approximate_match_hamming(text, pattern, k))
+
+    def test_numpy_suffix_array(self):
+        text = "ACGTTGCAACGTACGAACGT"
+        _, sa = build_suffix_array(text)
+        for pattern, k in [("ACGT", 0), ("ACGT", 1), ("TTGCA", 2)]:
+            assert (approximate_match_hamming_indexed(text, pattern, k, sa)
+                    == approximate_match_hamming(text, pattern, k))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,80 @@
+"""
+Unit tests for FASTA file operations.
+"""
+
+import pytest
+
+from src.core.fasta_operations import (
+    read_fasta_file,
+    read_sequence_bytes,
+    iter_fasta_lengths,
+    get_fasta_statistics,
+    FastaParseError
+)
+
+
+def write_fasta(tmp_path, content: bytes) -> str:
+    path = tmp_path / "test.fasta"
+    path.write_bytes(content)
+    return str(path)
+
+
+class TestReadFastaFile:
+    """Tests for parsing FASTA files."""
+
+    def test_multiline_records(self, tmp_path):
+        path = write_fasta(tmp_path, b">seq1 first one\nACGT\nacgt\n\n>seq2\r\nGG\r\nCC\r\n")
+        fasta = read_fasta_file(path)
+        assert [s.header for s in fasta] == ["seq1", "seq2"]
+        assert [s.description for s in fasta] == ["first one", ""]
+        assert [s.sequence for s in fasta] == ["ACGTacgt", "GGCC"]
+
+    def test_gt_inside_description(self, tmp_path):
+        path = write_fasta(tmp_path, b">a x>y and > z\nACGT\n")
+        fasta = read_fasta_file(path)
+        assert len(fasta) == 1
+        assert fasta[0].description == "x>y and > z"
+
+    def test_indented_header(self, tmp_path):
+        path = write_fasta(tmp_path, b" >a\nACGT\n\t>b desc\nGG\n")
+        fasta = read_fasta_file(path)
+        assert [(s.header, s.sequence) for s in fasta] == [("a", "ACGT"), ("b", "GG")]
+        assert fasta[1].description == "desc"
+
+    def test_data_before_header_raises(self, tmp_path):
+        path = write_fasta(tmp_path, b"\nACGT\n>a\nGG\n")
+        with pytest.raises(FastaParseError, match="line 2"):
+            read_fasta_file(path)
+
+    def test_empty_file_raises(self, tmp_path):
+        with pytest.raises(FastaParseError):
+            read_fasta_file(write_fasta(tmp_path, b""))
+
+
+class TestSequenceScans:
+    """Tests for the header-skipping sequence and length scans."""
+
+    def test_read_sequence_bytes(self, tmp_path):
+        path = write_fasta(tmp_path, b" >a\nacgt\n>b x>y\nGG\nCC\n")
+        assert read_sequence_bytes(path) == b"ACGTGGCC"
+
+    def test_iter_fasta_lengths(self, tmp_path):
+        path = write_fasta(tmp_path, b" >a one\nACGT\nAC\n>b\nGG\n")
+        assert list(iter_fasta_lengths(path)) == [("a one", 6), ("b", 2)]
+
+    def test_statistics(self, tmp_path):
+        path = write_fasta(tmp_path, b">a\nACGT\n>b\nGG\n")
+        stats = get_fasta_statistics(path)
+        assert stats['num_sequences'] == 2
+        assert stats['min_length'] == 2
+        assert stats['max_length'] == 4
+
+    def test_statistics_empty_file_raises(self, tmp_path):
+        for content in (b"", b"\n  \n"):
+            path = write_fasta(tmp_path, content)
+            with pytest.raises(FastaParseError):
+                get_fasta_statistics(path)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,69 @@
+"""
+Unit tests for indexing algorithms.
+"""
+
+import pytest
+
+from src.core.indexing import (
+    build_sorted_index,
+    query_index,
+    build_suffix_array,
+    build_suffix_array_simple
+)
+from src.core.indexing_fast import (
+    build_packed_index,
+    query_packed_index,
+    encode_dna,
+    _pack_kmers_kernel,
+    _pack_kmers_numpy
+)
+
+
+class TestPackedIndex:
+    """Tests for the 2-bit packed k-mer index."""
+
+    def test_matches_sorted_index(self):
+        text = "ACGTTGCAACGTACGAACGTACGT"
+        for pattern in ["ACGT", "A", "CGAAC", "GGGG", "TACGT"]:
+            index = build_packed_index(text, len(pattern))
+            expected = query_index(text, pattern,
+                                   build_sorted_index(text, len(pattern)))
+            assert query_packed_index(pattern, index) == expected
+
+    def test_case_insensitive(self):
+        index = build_packed_index("acgtACGT", 4)
+        assert query_packed_index("ACGT", index) == [0, 4]
+
+    def test_ambiguous_bases_skipped(self):
+        text = "ACGNNACGTNACG"
+        index = build_packed_index(text, 3)
+        assert query_packed_index("ACG", index) == [0, 5, 10]
+        assert query_packed_index("CGT", index) == [6]
+        assert len(index[0]) == 4
+
+    def test_kmer_too_long(self):
+        assert build_packed_index("A" * 40, 33) is None
+
+    def test_kernel_matches_numpy(self):
+        # Runs the undecorated kernel, so it is covered without Numba
+        codes = encode_dna("ACGTTGCAACGTACGAACGTTTGCAGGCATCGATCGAT")
+        for k in (1, 2, 5, 16, 31, 32):
+            assert (_pack_kmers_kernel(codes, k).tolist()
+                    == _pack_kmers_numpy(codes, k).tolist())
+
+
+class TestSuffixArray:
+    """Tests for NumPy suffix array construction."""
+
+    def test_matches_sorted_suffixes(self):
+        for text in ["", "A", "banana", "mississippi", "AAAAAAAA",
+                     "ACGTTGCAACGTACGAACGT", "abracadabra$"]:
+            ranks, sa = build_suffix_array(text)
+            expected = sorted(range(len(text)), key=lambda i: text[i:])
+            assert sa.tolist() == expected
+            assert build_suffix_array_simple(text) == expected
+            assert ranks[sa].tolist() == list(range(len(text)))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
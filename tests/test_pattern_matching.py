@@ -2,16 +2,18 @@
 Unit tests for pattern matching algorithms.
 """
 
-import pytest
-import sys
-import os
+import random
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import numpy as np
+import pytest
 
+from src.core._bm_kernel import _bad_character_kernel, last_occurrence_table
 from src.core.pattern_matching import (
     naive_match,
     naive_match_all,
-    bad_character_match
+    bad_character_match,
+    search,
+    multi_match
 )
 
 
@@ -35,6 +37,11 @@ class TestNaiveMatch:
     
     def test_pattern_longer_than_text(self):
         assert naive_match("AT", "ATGC") == -1
+    
+    def test_bytes_inputs(self):
+        assert naive_match(b"ATGCGATCGATCG", b"GATC") == 4
+        assert naive_match_all(bytearray(b"ATGATGATG"), "ATG") == [0, 3, 6]
+        assert bad_character_match(b"ATGCGATCGATCG", b"GATC") == 4
 
 
 class TestNaiveMatchAll:
@@ -51,6 +58,12 @@ class TestNaiveMatchAll:
     def test_no_matches(self):
         matches = naive_match_all("ATGC", "XX")
         assert matches == []
+    
+    def test_long_text(self):
+        text = "ACGTTGCA" * 500 + "GATTACA"
+        expected = [i for i in range(len(text)) if text.startswith("TGCAAC", i)]
+        assert naive_match_all(text, "TGCAAC") == expected
+        assert naive_match_all(text, "GATTACA") == [len(text) - 7]
 
 
 class TestBadCharacterMatch:
@@ -68,6 +81,44 @@ class TestBadCharacterMatch:
     def test_empty_inputs(self):
         assert bad_character_match("", "ATG") == -1
         assert bad_character_match("ATG", "") == -1
+    
+    def test_kernel_matches_find(self):
+        # Runs the undecorated kernel, so it is covered without Numba
+        rng = random.Random(0)
+        for _ in range(200):
+            text = "".join(rng.choices("ACGT", k=rng.randint(0, 60))).encode("ascii")
+            pattern = "".join(rng.choices("ACGT", k=rng.randint(1, 5))).encode("ascii")
+            p = np.frombuffer(pattern, dtype=np.uint8)
+            found = _bad_character_kernel(
+                np.frombuffer(text, dtype=np.uint8), p, last_occurrence_table(p)
+            )
+            assert found == text.find(pattern)
+
+
+class TestSearch:
+    """Tests for the size-based matcher dispatch."""
+    
+    def test_small_and_large_inputs(self):
+        assert search("ATGCGATCGATCG", "GATC") == 4
+        text = "ACGT" * 5000 + "GATTACAGATTACA"
+        assert search(text, "GATTACAGATTACA") == 20000
+        assert search(text, "TTTTTTTT") == -1
+    
+    def test_empty_inputs(self):
+        assert search("", "ATG") == -1
+        assert search("ATG", "") == -1
+
+
+class TestMultiMatch:
+    """Tests for single-pass multi-pattern matching."""
+    
+    def test_matches_naive(self):
+        text = "ACGTTGCAACGTACGAACGTAAAA"
+        patterns = ["ACGT", "CG", "AA", "GTACGAAC", "TTTT", "A", ""]
+        result = multi_match(text, patterns)
+        assert "" not in result
+        for pattern in patterns[:-1]:
+            assert result[pattern] == naive_match_all(text, pattern)
 
 
 if __name__ == "__main__":
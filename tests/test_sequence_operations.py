@@ -3,18 +3,15 @@ Unit tests for sequence operations.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.core.sequence_operations import (
     gc_content,
+    is_valid_dna,
     complement,
     reverse,
     reverse_complement,
-    translate_dna_to_protein
+    translate_dna_to_protein,
+    find_start_codons
 )
 
 
@@ -35,6 +32,18 @@ class TestGCContent:
             gc_content("")
 
 
+class TestIsValidDNA:
+    """Tests for DNA validation."""
+    
+    def test_valid_either_case(self):
+        assert is_valid_dna("ACGT")
+        assert is_valid_dna("acgt")
+    
+    def test_invalid_characters(self):
+        assert not is_valid_dna("ACGN")
+        assert not is_valid_dna("ACGé")
+
+
 class TestComplement:
     """Tests for DNA complement."""
     
@@ -93,6 +102,12 @@ class TestTranslation:
         full, orf = translate_dna_to_protein("AAATAG")
         assert full == "K*"
         assert orf == ""
+    
+    def test_find_start_codons(self):
+        seq = "CATGAatgNATGTT"
+        assert find_start_codons(seq) == [1, 5, 9]
+        assert find_start_codons(seq, frame=0) == [9]
+        assert find_start_codons("AT") == []
 
 
 if __name__ == "__main__":